@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Shared Launcher Helpers for WCS Analysis Platform
+
+Dependency checks, installation and the Streamlit launch used by run_app.py
+and quick_start.py.
+"""
+
+import os
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+REQUIRED_PACKAGES = ('streamlit', 'pandas', 'numpy', 'plotly')
+
+# Resolved once at import rather than probed on every call
+PROJECT_ROOT = Path(__file__).resolve().parent
+APP_FILE = PROJECT_ROOT / "src" / "app.py"
+# Kept as a string too - sys.path holds strings, so callers need not re-coerce
+SRC_DIR = str(APP_FILE.parent)
+
+
+def find_missing_packages(packages=REQUIRED_PACKAGES):
+    """
+    Find which packages are not installed
+
+    Only locates each package - importing pandas/streamlit here would cost seconds.
+
+    Args:
+        packages: Package names to check
+
+    Returns:
+        List of the package names that are missing
+    """
+    return [package for package in packages if find_spec(package) is None]
+
+
+def install_packages(packages):
+    """
+    Install packages with a single quiet pip invocation
+
+    Skips pip's self-version check (a PyPI round-trip) and never prompts.
+
+    Args:
+        packages: Package names to install
+
+    Returns:
+        True if pip succeeded, False otherwise
+    """
+    # Only needed when something is missing, so kept off the common import path
+    import subprocess
+
+    try:
+        subprocess.run([sys.executable, "-m", "pip", "install",
+                        "--disable-pip-version-check", "--no-input", "--quiet", *packages],
+                       check=True)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
+def ensure_dependencies(show_each=False):
+    """
+    Check the required packages and install any that are missing
+
+    Args:
+        show_each: Print the status of every required package, not just a summary
+
+    Returns:
+        True if all required packages are available, False if installing failed
+    """
+    missing_packages = find_missing_packages()
+
+    if show_each:
+        for package in REQUIRED_PACKAGES:
+            if package in missing_packages:
+                print(f"❌ {package} is missing")
+            else:
+                print(f"✅ {package} is installed")
+
+    if not missing_packages:
+        if not show_each:
+            print("✅ All dependencies are installed")
+        return True
+
+    print(f"\n📥 Installing missing packages: {', '.join(missing_packages)}")
+    if not install_packages(missing_packages):
+        print("❌ Failed to install dependencies")
+        return False
+
+    print("✅ Dependencies installed successfully")
+    return True
+
+
+def exec_streamlit(port=8501):
+    """
+    Replace the launcher process with the Streamlit server
+
+    On POSIX the launcher exec's into Streamlit, so no idle interpreter is left
+    waiting on a child and Ctrl+C goes straight to the server. Windows keeps a
+    child process because exec there does not replace the console process.
+
+    Args:
+        port: Port for the Streamlit server
+    """
+    args = [sys.executable, "-m", "streamlit", "run", str(APP_FILE),
+            "--server.port", str(port),
+            "--server.headless", "true"]
+
+    if os.name == 'nt':
+        import subprocess
+
+        try:
+            subprocess.run(args)
+        except KeyboardInterrupt:
+            print("\n👋 WCS Analysis Platform stopped")
+        return
+
+    # Anything still buffered would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, args)
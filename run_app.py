@@ -4,46 +4,26 @@ WCS Analysis Platform Launcher
 """
 
 import os
-import sys
-import subprocess
-import webbrowser
-import time
-from pathlib import Path
+from _launcher import APP_FILE, ensure_dependencies, exec_streamlit
 
-def check_dependencies():
-    """Check if required dependencies are installed"""
-    required_packages = ['streamlit', 'pandas', 'numpy', 'plotly']
-    
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
-    
-    if missing_packages:
-        print(f"❌ Missing required packages: {', '.join(missing_packages)}")
-        print("Installing missing packages...")
-        subprocess.run([sys.executable, "-m", "pip", "install"] + missing_packages)
-        print("✅ Dependencies installed successfully")
-    else:
-        print("✅ All dependencies are installed")
+# Fixed for the lifetime of the process, so looked up once at import
+WORKING_DIR = os.getcwd()
 
 def main():
     """Launch the WCS Analysis Platform"""
     
     print("🚀 Launching WCS Analysis Platform...")
-    print(f"📁 Working directory: {os.getcwd()}")
-    print(f"📄 App file: src/app.py")
+    print(f"📁 Working directory: {WORKING_DIR}")
+    print(f"📄 App file: {APP_FILE}")
     
-    # Check if we're in the right directory
-    if not Path("src/app.py").exists():
-        print("❌ Error: src/app.py not found")
-        print("Please run this script from the wcs-analysis-platform directory")
+    # Check the app is where the launcher expects it
+    if not APP_FILE.is_file():
+        print(f"❌ Error: {APP_FILE} not found")
+        print("Please run this script from a complete wcs-analysis-platform checkout")
         return
     
     # Check dependencies
-    check_dependencies()
+    ensure_dependencies()
     
     # Launch the app
     port = 8501
@@ -51,14 +31,8 @@ def main():
     print("⏹️  Press Ctrl+C to stop the server")
     
     try:
-        # Start Streamlit
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "src/app.py",
-            "--server.port", str(port),
-            "--server.headless", "true"
-        ])
-    except KeyboardInterrupt:
-        print("\n👋 WCS Analysis Platform stopped")
+        # Start Streamlit (takes over this process outside Windows)
+        exec_streamlit(port)
     except Exception as e:
         print(f"❌ Error launching app: {e}")
 
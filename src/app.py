@@ -12,10 +12,12 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 # Import our modules
-from file_ingestion import read_csv_with_metadata, validate_velocity_data
-from wcs_analysis import perform_wcs_analysis
+from file_ingestion import (ANALYSIS_COLUMNS, list_csv_files_with_sizes, read_csv_with_metadata,
+                            validate_velocity_data)
+from wcs_analysis import perform_wcs_analysis, load_cached_results, save_cached_results
 from visualization import create_velocity_visualization
-from batch_processing import process_batch_files, export_wcs_data_to_csv, create_combined_visualizations, create_combined_wcs_dataframe
+from batch_processing import (process_batch_files, export_wcs_data_to_csv,
+                              get_combined_visualizations, get_combined_wcs_dataframe)
 from data_export import export_data_matlab_format, get_export_formats
 
 
@@ -116,9 +118,11 @@ def main():
                 )
                 
                 if data_folder and os.path.exists(data_folder):
-                    csv_files = [f for f in os.listdir(data_folder) if f.endswith('.csv')]
+                    csv_entries = list_csv_files_with_sizes(data_folder)
+                    csv_files = [name for name, _ in csv_entries]
                     if csv_files:
-                        st.success(f"✅ Found {len(csv_files)} CSV files")
+                        total_size_mb = sum(size for _, size in csv_entries) / (1024 * 1024)
+                        st.success(f"✅ Found {len(csv_files)} CSV files ({total_size_mb:.1f} MB)")
                         
                         # Add "Select All" option
                         select_all = st.checkbox(
@@ -219,6 +223,18 @@ def main():
                 # Process files
                 all_results = []
                 
+                # Prepare parameters dictionary
+                parameters = {
+                    'sampling_rate': sampling_rate,
+                    'epoch_duration': epoch_duration,
+                    # Include primary + additional
+                    'epoch_durations': [epoch_duration] + epoch_durations,
+                    'th0_min': th0_min,
+                    'th0_max': th0_max,
+                    'th1_min': th1_min,
+                    'th1_max': th1_max,
+                }
+
                 for i, file_path in enumerate(selected_files):
                     # Get filename for display
                     if isinstance(file_path, str):
@@ -231,37 +247,34 @@ def main():
                     st.info(f"📊 Processing file {i+1}/{len(selected_files)}: {filename}")
                     
                     try:
-                        # Read and validate data
+                        # Unchanged folder files with the same parameters come from the cache
+                        results = None
                         if isinstance(file_path, str):
-                            # File from folder
-                            df, metadata, file_type_info = read_csv_with_metadata(file_path)
+                            results = load_cached_results(file_path, parameters)
+
+                        if results is not None:
+                            metadata = results['metadata']
                         else:
-                            # Uploaded file
-                            df, metadata, file_type_info = read_csv_with_metadata(file_path)
-                        
-                        # Validate velocity data
-                        if not validate_velocity_data(df):
-                            st.error(f"❌ Invalid velocity data in {filename}")
-                            continue
-                        
-                        # Prepare parameters dictionary
-                        parameters = {
-                            'sampling_rate': sampling_rate,
-                            'epoch_duration': epoch_duration,
-                            'epoch_durations': [epoch_duration] + epoch_durations,  # Include primary + additional
-                            'th0_min': th0_min,
-                            'th0_max': th0_max,
-                            'th1_min': th1_min,
-                            'th1_max': th1_max,
-                        }
-                        
-                        # Perform WCS analysis
-                        results = perform_wcs_analysis(
-                            df, 
-                            metadata, 
-                            file_type_info, 
-                            parameters
-                        )
+                            # Read and validate data
+                            df, metadata, file_type_info = read_csv_with_metadata(
+                                file_path, ANALYSIS_COLUMNS
+                            )
+
+                            # Validate velocity data
+                            if not validate_velocity_data(df):
+                                st.error(f"❌ Invalid velocity data in {filename}")
+                                continue
+
+                            # Perform WCS analysis
+                            results = perform_wcs_analysis(
+                                df,
+                                metadata,
+                                file_type_info,
+                                parameters
+                            )
+
+                            if results and isinstance(file_path, str):
+                                save_cached_results(file_path, parameters, results)
                         
                         # Store results with metadata
                         all_results.append({
@@ -309,7 +322,7 @@ def main():
                                 st.markdown("#### 📊 Combined Analysis Visualizations")
                                 
                                 # Create combined visualizations
-                                combined_viz = create_combined_visualizations(all_results)
+                                combined_viz = get_combined_visualizations(all_results)
                                 
                                 if combined_viz:
                                     # Display each visualization
@@ -380,14 +393,16 @@ def main():
                                 
                                 with col1:
                                     if st.button("📊 Standard CSV Export", help="Export all WCS analysis results to a CSV file in the OUTPUT folder"):
-                                        export_path = export_wcs_data_to_csv(all_results)
+                                        export_path = export_wcs_data_to_csv(
+                                            all_results, combined_df=get_combined_wcs_dataframe(all_results)
+                                        )
                                         if export_path:
                                             st.success(f"✅ Standard CSV exported successfully!")
                                             st.info(f"📁 File saved to: `{export_path}`")
                                 
                                 with col2:
                                     if st.button("📋 Download Combined Data", help="Download the combined WCS data as a CSV file"):
-                                        combined_df = create_combined_wcs_dataframe(all_results)
+                                        combined_df = get_combined_wcs_dataframe(all_results)
                                         if not combined_df.empty:
                                             csv_data = combined_df.to_csv(index=False)
                                             st.download_button(
@@ -425,7 +440,7 @@ def main():
                         st.markdown("#### 📊 Combined Analysis Visualizations")
                         
                         # Create combined visualizations
-                        combined_viz = create_combined_visualizations(all_results)
+                        combined_viz = get_combined_visualizations(all_results)
                         
                         if combined_viz:
                             # Display each visualization
@@ -496,14 +511,16 @@ def main():
                         
                         with col1:
                             if st.button("📊 Standard CSV Export", help="Export all WCS analysis results to a CSV file in the OUTPUT folder"):
-                                export_path = export_wcs_data_to_csv(all_results)
+                                export_path = export_wcs_data_to_csv(
+                                    all_results, combined_df=get_combined_wcs_dataframe(all_results)
+                                )
                                 if export_path:
                                     st.success(f"✅ Standard CSV exported successfully!")
                                     st.info(f"📁 File saved to: `{export_path}`")
                         
                         with col2:
                             if st.button("📋 Download Combined Data", help="Download the combined WCS data as a CSV file"):
-                                combined_df = create_combined_wcs_dataframe(all_results)
+                                combined_df = get_combined_wcs_dataframe(all_results)
                                 if not combined_df.empty:
                                     csv_data = combined_df.to_csv(index=False)
                                     st.download_button(
@@ -579,13 +596,30 @@ def display_wcs_results(results: Dict[str, Any], metadata: Dict[str, Any], inclu
     if 'processed_data' in results:
         processed_df = results['processed_data']
         
-        # Prepare velocity statistics
-        velocity_stats = {
-            'max_velocity': processed_df['Velocity'].max(),
-            'mean_velocity': processed_df['Velocity'].mean(),
-            'min_velocity': processed_df['Velocity'].min(),
-            'velocity_std': processed_df['Velocity'].std()
-        }
+        # Prepare velocity statistics - reuse the ones perform_wcs_analysis already
+        # computed in its fused pass rather than scanning the column four more times
+        precomputed_stats = results.get('velocity_stats')
+        if precomputed_stats:
+            # The analysis stores the population std; show the sample std (ddof=1)
+            # as pandas' Series.std() does
+            n_samples = precomputed_stats['total_samples']
+            if n_samples > 1:
+                velocity_std = precomputed_stats['std'] * np.sqrt(n_samples / (n_samples - 1))
+            else:
+                velocity_std = np.nan
+            velocity_stats = {
+                'max_velocity': precomputed_stats['max'],
+                'mean_velocity': precomputed_stats['mean'],
+                'min_velocity': precomputed_stats['min'],
+                'velocity_std': velocity_std
+            }
+        else:
+            velocity_stats = {
+                'max_velocity': processed_df['Velocity'].max(),
+                'mean_velocity': processed_df['Velocity'].mean(),
+                'min_velocity': processed_df['Velocity'].min(),
+                'velocity_std': processed_df['Velocity'].std()
+            }
         
         # Prepare kinematic statistics
         kinematic_stats = None
@@ -7,12 +7,33 @@ Handles processing of multiple files, CSV export, and combined visualizations.
 import pandas as pd
 import numpy as np
 import os
+import json
+import hashlib
+import itertools
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import streamlit as st
-from file_ingestion import read_csv_with_metadata, validate_velocity_data
-from wcs_analysis import perform_wcs_analysis
-from visualization import create_enhanced_wcs_visualization, create_kinematic_visualization
+from file_ingestion import ANALYSIS_COLUMNS, read_csv_with_metadata, validate_velocity_data
+from wcs_analysis import load_cached_results, perform_wcs_analysis, save_cached_results
+
+# Per-epoch colours for the combined charts, cycled when there are more epochs
+EPOCH_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7')
+
+# Colours for the WCS highlights and epoch bars in the individual player grid
+PLAYER_GRID_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1')
+
+# Samples kept per velocity profile in the player grid - each profile is a
+# half-width subplot, so more points than this are not visible anyway
+PLAYER_GRID_PLOT_POINTS = 2000
+
+# Columns of the combined WCS DataFrame, in export order
+COMBINED_WCS_COLUMNS = (
+    'File_Name', 'Player_Name', 'Epoch_Duration_Minutes', 'WCS_Method', 'Threshold_Type',
+    'WCS_Distance_m', 'WCS_Duration_s', 'Start_Time_s', 'End_Time_s', 'Avg_Velocity_m_s',
+    'File_Mean_Velocity_m_s', 'File_Max_Velocity_m_s', 'File_Min_Velocity_m_s',
+    'File_Velocity_Std_m_s',
+    'Total_Records', 'Duration_Minutes', 'Processing_Date'
+)
 
 
 def process_batch_files(file_inputs: List, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -37,13 +58,21 @@ def process_batch_files(file_inputs: List, parameters: Dict[str, Any]) -> List[D
                 progress = (i + 1) / len(file_inputs)
                 st.progress(progress)
             
+            # Unchanged files analysed with the same parameters come straight from the cache
+            if isinstance(file_input, str):
+                cached_results = load_cached_results(file_input, parameters)
+                if cached_results is not None:
+                    all_results.append(cached_results)
+                    st.success(f"✅ Loaded cached results for {cached_results['file_name']}")
+                    continue
+
             # Read file
             if isinstance(file_input, str):
                 # File path - pass directly to the function
-                df, metadata, file_type_info = read_csv_with_metadata(file_input)
+                df, metadata, file_type_info = read_csv_with_metadata(file_input, ANALYSIS_COLUMNS)
             else:
                 # Uploaded file
-                df, metadata, file_type_info = read_csv_with_metadata(file_input)
+                df, metadata, file_type_info = read_csv_with_metadata(file_input, ANALYSIS_COLUMNS)
             
             if df is not None and metadata is not None:
                 # Validate velocity data
@@ -59,6 +88,9 @@ def process_batch_files(file_inputs: List, parameters: Dict[str, Any]) -> List[D
                         results['file_name'] = os.path.basename(file_input) if isinstance(file_input, str) else file_input.name
                         results['file_path'] = file_input if isinstance(file_input, str) else file_input.name
                         
+                        if isinstance(file_input, str):
+                            save_cached_results(file_input, parameters, results)
+
                         all_results.append(results)
                         st.success(f"✅ Successfully processed {results['file_name']}")
                     else:
@@ -84,163 +116,155 @@ def create_combined_wcs_dataframe(all_results: List[Dict[str, Any]]) -> pd.DataF
     Returns:
         Combined DataFrame with all WCS data
     """
-    combined_data = []
+    # One timestamp for the whole export, rather than a clock read (and a
+    # possibly different second) per row
+    processing_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def iter_rows():
+        for result in all_results:
+            metadata = result['metadata']
+
+            # Get data from the new structure
+            epoch_durations = result.get('epoch_durations', [])
+            velocity_stats = result.get('velocity_stats', {})
+
+            player_name = metadata.get('player_name', 'Unknown')
+            file_name = result.get('file_name', 'Unknown')
+
+            # If file_name is not in result, get it from file_path
+            if file_name == 'Unknown':
+                file_path = result.get('file_path', 'Unknown')
+                if isinstance(file_path, str):
+                    file_name = os.path.basename(file_path)
+                else:
+                    file_name = file_path.name if hasattr(file_path, 'name') else 'Unknown'
+
+            # Per-file values shared by every row of this file, looked up once
+            file_values = (
+                velocity_stats.get('mean', 0),
+                velocity_stats.get('max', 0),
+                velocity_stats.get('min', 0),
+                velocity_stats.get('std', 0),
+                metadata.get('total_records', 0),
+                metadata.get('duration_minutes', 0),
+                processing_date
+            )
+
+            for method, results_key in (('Rolling', 'rolling_wcs_results'),
+                                        ('Contiguous', 'contiguous_wcs_results')):
+                for i, epoch_result in enumerate(result.get(results_key, [])):
+                    if len(epoch_result) < 8:
+                        continue
+
+                    if i < len(epoch_durations):
+                        epoch_duration = epoch_durations[i]
+                    else:
+                        epoch_duration = f"Epoch_{i+1}"
+
+                    # Default threshold in columns 0-3, Threshold 1 in columns 4-7
+                    for threshold_type, offset in (('Default Threshold', 0), ('Threshold 1', 4)):
+                        distance = epoch_result[offset]
+                        duration = epoch_result[offset + 1]
+                        avg_velocity = distance / duration if duration > 0 else 0
+
+                        yield (
+                            file_name, player_name, epoch_duration, method, threshold_type,
+                            distance, duration,
+                            epoch_result[offset + 2] / 10, epoch_result[offset + 3] / 10,
+                            avg_velocity
+                        ) + file_values
     
+    # Rows as plain tuples with the columns fixed up front - no per-row dicts
+    combined_df = pd.DataFrame.from_records(iter_rows(), columns=COMBINED_WCS_COLUMNS)
+
+    # Low-cardinality labels as categoricals, so the threshold filters compare
+    # small integer codes instead of strings and the player group-bys group on codes
+    if not combined_df.empty:
+        combined_df['Player_Name'] = combined_df['Player_Name'].astype('category')
+        combined_df['WCS_Method'] = combined_df['WCS_Method'].astype('category')
+        combined_df['Threshold_Type'] = combined_df['Threshold_Type'].astype('category')
+
+    return combined_df
+
+
+def get_results_cache_key(all_results: List[Dict[str, Any]]) -> str:
+    """
+    Build a session-state cache key from the files and parameters of a batch
+
+    Args:
+        all_results: List of results from batch processing
+
+    Returns:
+        Hex digest of every result's file name and analysis parameters, in order
+    """
+    key = []
     for result in all_results:
-        metadata = result['metadata']
-        
-        # Get data from the new structure
-        rolling_wcs_results = result.get('rolling_wcs_results', [])
-        contiguous_wcs_results = result.get('contiguous_wcs_results', [])
-        epoch_durations = result.get('epoch_durations', [])
-        velocity_stats = result.get('velocity_stats', {})
-        
-        player_name = metadata.get('player_name', 'Unknown')
-        file_name = result.get('file_name', 'Unknown')
-        
-        # If file_name is not in result, get it from file_path
-        if file_name == 'Unknown':
-            file_path = result.get('file_path', 'Unknown')
-            if isinstance(file_path, str):
-                file_name = os.path.basename(file_path)
-            else:
-                file_name = file_path.name if hasattr(file_path, 'name') else 'Unknown'
-        
-        # Process rolling WCS results
-        for i, epoch_result in enumerate(rolling_wcs_results):
-            if len(epoch_result) >= 8:
-                epoch_duration = epoch_durations[i] if i < len(epoch_durations) else f"Epoch_{i+1}"
-                
-                # Default threshold data (rolling)
-                th0_distance = epoch_result[0]
-                th0_duration = epoch_result[1]
-                th0_start = epoch_result[2] / 10
-                th0_end = epoch_result[3] / 10
-                th0_avg_velocity = th0_distance / th0_duration if th0_duration > 0 else 0
-                
-                combined_data.append({
-                    'File_Name': file_name,
-                    'Player_Name': player_name,
-                    'Epoch_Duration_Minutes': epoch_duration,
-                    'WCS_Method': 'Rolling',
-                    'Threshold_Type': 'Default Threshold',
-                    'WCS_Distance_m': th0_distance,
-                    'WCS_Duration_s': th0_duration,
-                    'Start_Time_s': th0_start,
-                    'End_Time_s': th0_end,
-                    'Avg_Velocity_m_s': th0_avg_velocity,
-                    'File_Mean_Velocity_m_s': velocity_stats.get('mean', 0),
-                    'File_Max_Velocity_m_s': velocity_stats.get('max', 0),
-                    'File_Min_Velocity_m_s': velocity_stats.get('min', 0),
-                    'File_Velocity_Std_m_s': velocity_stats.get('std', 0),
-                    'Total_Records': metadata.get('total_records', 0),
-                    'Duration_Minutes': metadata.get('duration_minutes', 0),
-                    'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                
-                # Threshold 1 data (rolling)
-                th1_distance = epoch_result[4]
-                th1_duration = epoch_result[5]
-                th1_start = epoch_result[6] / 10
-                th1_end = epoch_result[7] / 10
-                th1_avg_velocity = th1_distance / th1_duration if th1_duration > 0 else 0
-                
-                combined_data.append({
-                    'File_Name': file_name,
-                    'Player_Name': player_name,
-                    'Epoch_Duration_Minutes': epoch_duration,
-                    'WCS_Method': 'Rolling',
-                    'Threshold_Type': 'Threshold 1',
-                    'WCS_Distance_m': th1_distance,
-                    'WCS_Duration_s': th1_duration,
-                    'Start_Time_s': th1_start,
-                    'End_Time_s': th1_end,
-                    'Avg_Velocity_m_s': th1_avg_velocity,
-                    'File_Mean_Velocity_m_s': velocity_stats.get('mean', 0),
-                    'File_Max_Velocity_m_s': velocity_stats.get('max', 0),
-                    'File_Min_Velocity_m_s': velocity_stats.get('min', 0),
-                    'File_Velocity_Std_m_s': velocity_stats.get('std', 0),
-                    'Total_Records': metadata.get('total_records', 0),
-                    'Duration_Minutes': metadata.get('duration_minutes', 0),
-                    'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        # Process contiguous WCS results
-        for i, epoch_result in enumerate(contiguous_wcs_results):
-            if len(epoch_result) >= 8:
-                epoch_duration = epoch_durations[i] if i < len(epoch_durations) else f"Epoch_{i+1}"
-                
-                # Default threshold data (contiguous)
-                th0_distance = epoch_result[0]
-                th0_duration = epoch_result[1]
-                th0_start = epoch_result[2] / 10
-                th0_end = epoch_result[3] / 10
-                th0_avg_velocity = th0_distance / th0_duration if th0_duration > 0 else 0
-                
-                combined_data.append({
-                    'File_Name': file_name,
-                    'Player_Name': player_name,
-                    'Epoch_Duration_Minutes': epoch_duration,
-                    'WCS_Method': 'Contiguous',
-                    'Threshold_Type': 'Default Threshold',
-                    'WCS_Distance_m': th0_distance,
-                    'WCS_Duration_s': th0_duration,
-                    'Start_Time_s': th0_start,
-                    'End_Time_s': th0_end,
-                    'Avg_Velocity_m_s': th0_avg_velocity,
-                    'File_Mean_Velocity_m_s': velocity_stats.get('mean', 0),
-                    'File_Max_Velocity_m_s': velocity_stats.get('max', 0),
-                    'File_Min_Velocity_m_s': velocity_stats.get('min', 0),
-                    'File_Velocity_Std_m_s': velocity_stats.get('std', 0),
-                    'Total_Records': metadata.get('total_records', 0),
-                    'Duration_Minutes': metadata.get('duration_minutes', 0),
-                    'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                
-                # Threshold 1 data (contiguous)
-                th1_distance = epoch_result[4]
-                th1_duration = epoch_result[5]
-                th1_start = epoch_result[6] / 10
-                th1_end = epoch_result[7] / 10
-                th1_avg_velocity = th1_distance / th1_duration if th1_duration > 0 else 0
-                
-                combined_data.append({
-                    'File_Name': file_name,
-                    'Player_Name': player_name,
-                    'Epoch_Duration_Minutes': epoch_duration,
-                    'WCS_Method': 'Contiguous',
-                    'Threshold_Type': 'Threshold 1',
-                    'WCS_Distance_m': th1_distance,
-                    'WCS_Duration_s': th1_duration,
-                    'Start_Time_s': th1_start,
-                    'End_Time_s': th1_end,
-                    'Avg_Velocity_m_s': th1_avg_velocity,
-                    'File_Mean_Velocity_m_s': velocity_stats.get('mean', 0),
-                    'File_Max_Velocity_m_s': velocity_stats.get('max', 0),
-                    'File_Min_Velocity_m_s': velocity_stats.get('min', 0),
-                    'File_Velocity_Std_m_s': velocity_stats.get('std', 0),
-                    'Total_Records': metadata.get('total_records', 0),
-                    'Duration_Minutes': metadata.get('duration_minutes', 0),
-                    'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-    
-    return pd.DataFrame(combined_data)
+        file_path = result.get('file_path', result.get('file_name'))
+        if not isinstance(file_path, str):
+            file_path = getattr(file_path, 'name', None)
+        # Results from the app nest the analysis output under 'results'
+        parameters = (result.get('results') or result).get('parameters')
+        key.append((file_path, parameters))
+    key = json.dumps(key, sort_keys=True, default=str)
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
 
-def export_wcs_data_to_csv(all_results: List[Dict[str, Any]], output_folder: str = "OUTPUT") -> str:
+def get_combined_wcs_dataframe(all_results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Get the combined WCS DataFrame, reusing the one already built for these results
+
+    The combined charts and the download button both flatten the same batch
+    results. The frame is kept in session state under the batch's files and
+    parameters, so the flattening runs once per analysis rather than once per
+    consumer on every rerun.
+
+    Args:
+        all_results: List of results from batch processing
+
+    Returns:
+        Combined DataFrame with all WCS data
+    """
+    key = get_results_cache_key(all_results)
+    cached = st.session_state.get('combined_wcs_dataframe')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    combined_df = create_combined_wcs_dataframe(all_results)
+    st.session_state['combined_wcs_dataframe'] = (key, combined_df)
+    return combined_df
+
+
+def get_default_threshold_rows(combined_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select the Default Threshold rows of a combined WCS DataFrame
+
+    Args:
+        combined_df: DataFrame from create_combined_wcs_dataframe
+
+    Returns:
+        DataFrame with only the Default Threshold rows
+    """
+    return combined_df[combined_df['Threshold_Type'] == 'Default Threshold']
+
+
+def export_wcs_data_to_csv(all_results: List[Dict[str, Any]], output_folder: str = "OUTPUT",
+                           combined_df: Optional[pd.DataFrame] = None) -> str:
     """
     Export all WCS data to a CSV file
     
     Args:
         all_results: List of results from batch processing
         output_folder: Folder to save the CSV file
+        combined_df: Optional DataFrame already built by create_combined_wcs_dataframe
+            for these results; built here if not given
         
     Returns:
         Path to the exported CSV file
     """
     try:
         # Create combined DataFrame
-        combined_df = create_combined_wcs_dataframe(all_results)
+        if combined_df is None:
+            combined_df = create_combined_wcs_dataframe(all_results)
         
         if combined_df.empty:
             st.warning("No WCS data to export")
@@ -283,7 +307,7 @@ def create_combined_visualizations(all_results: List[Dict[str, Any]]) -> Dict[st
             return {}
         
         # Create combined DataFrame
-        combined_df = create_combined_wcs_dataframe(all_results)
+        combined_df = get_combined_wcs_dataframe(all_results)
         
         if combined_df.empty:
             st.warning("No data available for combined visualizations")
@@ -299,13 +323,16 @@ def create_combined_visualizations(all_results: List[Dict[str, Any]]) -> Dict[st
         # Create different types of combined visualizations
         visualizations = {}
         
+        # Three of the charts use only the Default Threshold rows - filter once
+        default_df = get_default_threshold_rows(combined_df)
+
         # 1. WCS Distance Distribution by Epoch (Box Plot)
-        fig_box = create_wcs_distance_distribution(combined_df)
+        fig_box = create_wcs_distance_distribution(combined_df, default_df)
         if fig_box:
             visualizations['wcs_distance_distribution'] = fig_box
         
         # 2. Mean WCS Distance vs Epoch Duration (Line Plot)
-        fig_line = create_mean_wcs_distance_trend(combined_df)
+        fig_line = create_mean_wcs_distance_trend(combined_df, default_df)
         if fig_line:
             visualizations['mean_wcs_distance_trend'] = fig_line
         
@@ -315,7 +342,7 @@ def create_combined_visualizations(all_results: List[Dict[str, Any]]) -> Dict[st
             visualizations['player_comparison'] = fig_bar
         
         # 4. WCS Distance Heatmap by Player and Epoch
-        fig_heatmap = create_player_epoch_heatmap(combined_df)
+        fig_heatmap = create_player_epoch_heatmap(combined_df, default_df)
         if fig_heatmap:
             visualizations['player_epoch_heatmap'] = fig_heatmap
         
@@ -331,30 +358,65 @@ def create_combined_visualizations(all_results: List[Dict[str, Any]]) -> Dict[st
         return {}
 
 
-def create_wcs_distance_distribution(combined_df: pd.DataFrame):
+def get_combined_visualizations(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Get the combined visualizations, reusing the figures already built for these results
+
+    Streamlit reruns the whole script on every interaction, while the batch
+    results stay the same until the next analysis. The figures are therefore
+    kept in session state under the batch's files and parameters and only
+    rebuilt when those change.
+
+    Args:
+        all_results: List of results from batch processing
+
+    Returns:
+        Dictionary containing visualization figures
+    """
+    key = get_results_cache_key(all_results)
+    cached = st.session_state.get('combined_visualizations')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    visualizations = create_combined_visualizations(all_results)
+    st.session_state['combined_visualizations'] = (key, visualizations)
+    return visualizations
+
+
+def create_wcs_distance_distribution(combined_df: pd.DataFrame,
+                                     default_df: Optional[pd.DataFrame] = None):
     """Create WCS distance distribution box plot"""
     try:
         import plotly.graph_objects as go
         
-        # Filter for Default Threshold only for cleaner visualization
-        df_filtered = combined_df[combined_df['Threshold_Type'] == 'Default Threshold']
-        
-        # Create box plot
-        fig = go.Figure()
-        
-        epochs = sorted(df_filtered['Epoch_Duration_Minutes'].unique())
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
+        # Filter for Default Threshold only for cleaner visualization (unless already filtered)
+        if default_df is not None:
+            df_filtered = default_df
+        else:
+            df_filtered = get_default_threshold_rows(combined_df)
+        
+        # Sort rows by epoch once and slice each epoch's distances by offset,
+        # rather than re-scanning the whole frame with a boolean mask per epoch
+        epoch_values = df_filtered['Epoch_Duration_Minutes'].to_numpy()
+        order = np.argsort(epoch_values, kind='stable')
+        sorted_epochs = epoch_values[order]
+        sorted_distances = df_filtered['WCS_Distance_m'].to_numpy()[order]
+
+        epochs = np.unique(sorted_epochs)
+        indptr = np.searchsorted(sorted_epochs, epochs, side='left').tolist() + [len(sorted_epochs)]
         
-        for i, epoch in enumerate(epochs):
-            epoch_data = df_filtered[df_filtered['Epoch_Duration_Minutes'] == epoch]['WCS_Distance_m']
-            
-            fig.add_trace(go.Box(
-                y=epoch_data,
+        # Create box plot - one box per epoch, handed to the figure in a single call
+        fig = go.Figure(data=[
+            go.Box(
+                y=sorted_distances[start:end],
                 name=f"{epoch}min",
-                marker_color=colors[i % len(colors)],
+                marker_color=color,
                 boxpoints='outliers',
                 hovertemplate='Epoch: %{fullData.name}<br>Distance: %{y:.1f}m<extra></extra>'
-            ))
+            )
+            for epoch, start, end, color in zip(epochs, indptr[:-1], indptr[1:],
+                                                itertools.cycle(EPOCH_COLORS))
+        ])
         
         fig.update_layout(
             title="WCS Distance Distribution by Epoch",
@@ -371,27 +433,43 @@ def create_wcs_distance_distribution(combined_df: pd.DataFrame):
         return None
 
 
-def create_mean_wcs_distance_trend(combined_df: pd.DataFrame):
+def create_mean_wcs_distance_trend(combined_df: pd.DataFrame,
+                                   default_df: Optional[pd.DataFrame] = None):
     """Create mean WCS distance trend line plot"""
     try:
         import plotly.graph_objects as go
         
-        # Filter for Default Threshold only
-        df_filtered = combined_df[combined_df['Threshold_Type'] == 'Default Threshold']
-        
-        # Calculate mean and std for each epoch
-        epoch_stats = df_filtered.groupby('Epoch_Duration_Minutes')['WCS_Distance_m'].agg(['mean', 'std']).reset_index()
+        # Filter for Default Threshold only (unless already filtered)
+        if default_df is not None:
+            df_filtered = default_df
+        else:
+            df_filtered = get_default_threshold_rows(combined_df)
+        
+        # Mean and sample std for each epoch from bincount sums over integer epoch
+        # codes - a few vectorised passes instead of a groupby object per rebuild.
+        # The std sums squared deviations from the mean, which stays accurate
+        # where a sum-of-squares shortcut would cancel
+        epochs, codes = np.unique(df_filtered['Epoch_Duration_Minutes'].to_numpy(),
+                                  return_inverse=True)
+        distances = df_filtered['WCS_Distance_m'].to_numpy(dtype=np.float64)
+        counts = np.bincount(codes, minlength=len(epochs))
+        means = np.bincount(codes, weights=distances, minlength=len(epochs)) / counts
+        squared_deviations = np.bincount(codes, weights=(distances - means[codes]) ** 2,
+                                         minlength=len(epochs))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # NaN for a single-file epoch, as pandas gives
+            stds = np.sqrt(squared_deviations / (counts - 1))
         
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
-            x=epoch_stats['Epoch_Duration_Minutes'],
-            y=epoch_stats['mean'],
+            x=epochs,
+            y=means,
             mode='lines+markers',
             name='Mean WCS Distance',
             line=dict(color='#FF6B6B', width=3),
             marker=dict(size=8),
-            error_y=dict(type='data', array=epoch_stats['std'], visible=True),
+            error_y=dict(type='data', array=stds, visible=True),
             hovertemplate='Epoch: %{x}min<br>Mean Distance: %{y:.1f}m<br>Std: %{error_y.array:.1f}m<extra></extra>'
         ))
         
@@ -415,13 +493,18 @@ def create_player_comparison(combined_df: pd.DataFrame):
         import plotly.graph_objects as go
         
         # Calculate average WCS distance per player across all epochs
-        player_stats = combined_df.groupby('Player_Name')['WCS_Distance_m'].mean().sort_values(ascending=False)
+        # (groups are re-ordered by value below, so the key sort is skipped)
+        player_stats = (
+            combined_df.groupby('Player_Name', sort=False, observed=True)['WCS_Distance_m']
+            .mean()
+            .sort_values(ascending=False)
+        )
         
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
-            x=player_stats.index,
-            y=player_stats.values,
+            x=player_stats.index.to_numpy(),
+            y=player_stats.to_numpy(),
             marker_color='#4ECDC4',
             hovertemplate='Player: %{x}<br>Avg Distance: %{y:.1f}m<extra></extra>'
         ))
@@ -441,26 +524,31 @@ def create_player_comparison(combined_df: pd.DataFrame):
         return None
 
 
-def create_player_epoch_heatmap(combined_df: pd.DataFrame):
+def create_player_epoch_heatmap(combined_df: pd.DataFrame,
+                                default_df: Optional[pd.DataFrame] = None):
     """Create player vs epoch heatmap"""
     try:
         import plotly.graph_objects as go
         
-        # Filter for Default Threshold only
-        df_filtered = combined_df[combined_df['Threshold_Type'] == 'Default Threshold']
-        
-        # Create pivot table
-        pivot_df = df_filtered.pivot_table(
-            values='WCS_Distance_m',
-            index='Player_Name',
-            columns='Epoch_Duration_Minutes',
-            aggfunc='mean'
+        # Filter for Default Threshold only (unless already filtered)
+        if default_df is not None:
+            df_filtered = default_df
+        else:
+            df_filtered = get_default_threshold_rows(combined_df)
+        
+        # Player x epoch means from a single group-by pass, unstacked into a grid
+        pivot_df = (
+            df_filtered.groupby(['Player_Name', 'Epoch_Duration_Minutes'],
+                                observed=True)['WCS_Distance_m']
+            .mean()
+            .unstack('Epoch_Duration_Minutes')
         )
         
+        # Hand Plotly plain arrays; float32 halves the serialised grid
         fig = go.Figure(data=go.Heatmap(
-            z=pivot_df.values,
-            x=pivot_df.columns,
-            y=pivot_df.index,
+            z=pivot_df.to_numpy(dtype=np.float32),
+            x=pivot_df.columns.to_numpy(),
+            y=pivot_df.index.to_numpy(),
             colorscale='RdYlBu_r',
             hovertemplate='Player: %{y}<br>Epoch: %{x}min<br>Distance: %{z:.1f}m<extra></extra>'
         ))
@@ -484,6 +572,7 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
     try:
         from plotly.subplots import make_subplots
         import plotly.graph_objects as go
+        from visualization import append_layout_items, decimate_min_max
         
         # Limit to first 3 players for better readability and prevent overlapping
         max_players = min(3, len(all_results))
@@ -499,6 +588,9 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
             specs=[[{"secondary_y": False}, {"secondary_y": False}] for _ in range(max_players)]
         )
         
+        # Highlights for every player are collected and added in one layout update
+        highlight_shapes = []
+
         for i, result in enumerate(selected_results):
             row = i + 1
             player_name = result['metadata'].get('player_name', 'Unknown')
@@ -522,12 +614,17 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
                 
                 # Limit time range for better visibility (first 10 minutes)
                 max_time = min(600, time_data.max())  # 10 minutes = 600 seconds
-                mask = time_data <= max_time
+                mask = np.asarray(time_data <= max_time)
+                profile_time = np.asarray(time_data)[mask]
+                profile_velocity = df['Velocity'].to_numpy()[mask]
+
+                # Keep each bucket's min and max sample so sprint peaks survive
+                keep = decimate_min_max(profile_velocity, PLAYER_GRID_PLOT_POINTS)
                 
                 fig.add_trace(
                     go.Scatter(
-                        x=time_data[mask],
-                        y=df['Velocity'][mask],
+                        x=profile_time[keep],
+                        y=profile_velocity[keep],
                         mode='lines',
                         name=f'{player_name} - Velocity',
                         line=dict(color='#2E86AB', width=1),
@@ -536,10 +633,11 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
                     row=row, col=1
                 )
                 
-                # Add WCS period highlights (only if within time range)
-                colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-                
-                for j, epoch_result in enumerate(wcs_results):
+                # Add WCS period highlights (only if within time range), on this
+                # row's left subplot - axes are numbered row by row across 2 columns
+                axis_number = 2 * i + 1
+                axis_suffix = str(axis_number) if axis_number > 1 else ''
+                for epoch_result, color in zip(wcs_results, itertools.cycle(PLAYER_GRID_COLORS)):
                     if len(epoch_result) >= 8:
                         th0_start = epoch_result[2] / 10
                         th0_end = epoch_result[3] / 10
@@ -547,14 +645,16 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
                         
                         # Only show highlights if they're within the displayed time range
                         if th0_start <= max_time:
-                            fig.add_vrect(
+                            highlight_shapes.append(dict(
+                                type="rect",
                                 x0=th0_start, x1=min(th0_end, max_time),
-                                fillcolor=colors[j % len(colors)],
+                                y0=0, y1=1,
+                                xref=f"x{axis_suffix}", yref=f"y{axis_suffix} domain",
+                                fillcolor=color,
                                 opacity=0.3,
                                 layer="below",
-                                line_width=0,
-                                row=row, col=1
-                            )
+                                line=dict(width=0)
+                            ))
             
             # Epoch comparison (right column)
             
@@ -567,13 +667,15 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
                         x=epoch_labels,
                         y=distances,
                         name=f'{player_name} - Epochs',
-                        marker_color=colors[:len(distances)],
+                        marker_color=list(PLAYER_GRID_COLORS[:len(distances)]),
                         showlegend=False,
                         hovertemplate='Epoch: %{x}<br>Distance: %{y:.1f}m<extra></extra>'
                     ),
                     row=row, col=2
                 )
         
+        append_layout_items(fig, highlight_shapes)
+
         fig.update_layout(
             title="Individual Player Analysis (Top 3 Players)",
             height=300 * max_players,  # Increased height per player
@@ -583,8 +685,7 @@ def create_individual_player_grid(all_results: List[Dict[str, Any]]):
         )
         
         # Update subplot titles to be more compact
-        for i in range(len(fig.layout.annotations)):
-            fig.layout.annotations[i].font.size = 11
+        fig.update_annotations(font_size=11)
         
         return fig
         
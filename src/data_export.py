@@ -10,6 +10,32 @@ from typing import Dict, List, Any, Optional
 import os
 from pathlib import Path
 
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+
+def open_excel_writer(full_path: str) -> pd.ExcelWriter:
+    """
+    Open an Excel writer for the MATLAB format workbook
+
+    xlsxwriter is preferred: it writes large sheets noticeably faster than
+    openpyxl and holds less per cell. Its constant_memory mode is not used
+    because pandas writes each sheet column by column, and that mode drops any
+    cell added to a row that has already been flushed. openpyxl is the fallback.
+
+    Args:
+        full_path: Path of the workbook to create
+
+    Returns:
+        An open pd.ExcelWriter
+    """
+    if XLSXWRITER_AVAILABLE:
+        return pd.ExcelWriter(full_path, engine='xlsxwriter')
+    return pd.ExcelWriter(full_path, engine='openpyxl')
+
 
 def create_matlab_format_export(
     all_results: List[Dict[str, Any]], 
@@ -34,7 +60,7 @@ def create_matlab_format_export(
     full_path = os.path.join(output_path, filename)
     
     # Create Excel writer
-    with pd.ExcelWriter(full_path, engine='openpyxl') as writer:
+    with open_excel_writer(full_path) as writer:
         
         # 1. Create WCS Report Sheet
         wcs_report_df = create_wcs_report_sheet(all_results)
@@ -42,12 +68,14 @@ def create_matlab_format_export(
             wcs_report_df.to_excel(writer, sheet_name="WCS Report", index=False)
         
         # 2. Create Summary Maximum Values Sheet
-        summary_df = create_summary_max_values_sheet(all_results)
+        # The summary and binned sheets share one flattening of the rolling periods
+        periods = flatten_rolling_wcs_periods(all_results)
+        summary_df = create_summary_max_values_sheet(all_results, periods)
         if not summary_df.empty:
             summary_df.to_excel(writer, sheet_name="Summary Maximum Values", index=False)
         
         # 3. Create Binned Data Sheets for each epoch
-        create_binned_data_sheets(all_results, writer)
+        create_binned_data_sheets(all_results, writer, periods)
     
     return full_path
 
@@ -179,13 +207,23 @@ def create_wcs_report_sheet(all_results: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def create_summary_max_values_sheet(all_results: List[Dict[str, Any]]) -> pd.DataFrame:
+def flatten_rolling_wcs_periods(all_results: List[Dict[str, Any]]) -> pd.DataFrame:
     """
-    Create Summary Maximum Values sheet with max values for each epoch
+    Flatten the rolling WCS periods of every successful result into one frame
+
+    The summary and binned sheets both read these periods; flattening them once
+    lets the workbook export share a single pass over the nested results.
+
+    Args:
+        all_results: List of analysis results for each file
+
+    Returns:
+        DataFrame with one row per rolling WCS period (Result, PLAYER_METADATA,
+        Epoch_Duration, Threshold_Num, Distance, Start_Time), empty if none
     """
-    summary_data = []
+    period_rows = []
     
-    for result in all_results:
+    for result_index, result in enumerate(all_results):
         if not result.get('analysis_successful', False):
             continue
             
@@ -195,15 +233,8 @@ def create_summary_max_values_sheet(all_results: List[Dict[str, Any]]) -> pd.Dat
         wcs_results = result.get('wcs_results', {})
         rolling_wcs = wcs_results.get('rolling_wcs', [])
         
-        # Group by epoch duration
-        epoch_data = {}
         for wcs_period in rolling_wcs:
-            epoch_duration = wcs_period.get('epoch_duration', 0)
             threshold_name = wcs_period.get('threshold_name', 'Default Threshold')
-            distance = wcs_period.get('distance', 0)
-            
-            if epoch_duration not in epoch_data:
-                epoch_data[epoch_duration] = {}
             
             if 'Default' in threshold_name:
                 threshold_num = 0
@@ -212,93 +243,87 @@ def create_summary_max_values_sheet(all_results: List[Dict[str, Any]]) -> pd.Dat
             else:
                 threshold_num = 0
             
-            key = f'Distance_TH_{threshold_num}'
-            if key not in epoch_data[epoch_duration]:
-                epoch_data[epoch_duration][key] = []
-            epoch_data[epoch_duration][key].append(distance)
-        
-        # Create summary rows
-        for epoch_duration, thresholds in epoch_data.items():
-            row_data = {
-                'PLAYER_METADATA': player_name,
-                'Epoch': epoch_duration
-            }
-            
-            for threshold_key, distances in thresholds.items():
-                row_data[threshold_key] = max(distances) if distances else 0
-            
-            summary_data.append(row_data)
+            period_rows.append((result_index, player_name, wcs_period.get('epoch_duration', 0),
+                                threshold_num, wcs_period.get('distance', 0),
+                                wcs_period.get('start_time', 0)))
+
+    return pd.DataFrame.from_records(
+        period_rows,
+        columns=['Result', 'PLAYER_METADATA', 'Epoch_Duration', 'Threshold_Num', 'Distance',
+                 'Start_Time']
+    )
+
+
+def create_summary_max_values_sheet(all_results: List[Dict[str, Any]],
+                                    periods: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Create Summary Maximum Values sheet with max values for each epoch
+    """
+    if periods is None:
+        periods = flatten_rolling_wcs_periods(all_results)
     
-    if summary_data:
-        df = pd.DataFrame(summary_data)
-        # Reorder columns
-        column_order = ['PLAYER_METADATA', 'Epoch']
-        for col in df.columns:
-            if col not in column_order:
-                column_order.append(col)
-        
-        return df[column_order]
-    else:
+    if periods.empty:
         return pd.DataFrame()
 
+    # A single group-by for the per-epoch maxima instead of building nested
+    # per-file, per-epoch dictionaries
+    periods = pd.DataFrame({
+        'Result': periods['Result'],
+        'PLAYER_METADATA': periods['PLAYER_METADATA'],
+        'Epoch': periods['Epoch_Duration'],
+        'Threshold': 'Distance_TH_' + periods['Threshold_Num'].astype(str),
+        'Distance': periods['Distance']
+    })
+    row_keys = ['Result', 'PLAYER_METADATA', 'Epoch']
+
+    max_distances = (
+        periods.groupby(row_keys + ['Threshold'], sort=False)['Distance']
+        .max()
+        .unstack('Threshold')
+    )
+
+    # Keep files, epochs and thresholds in the order they were first seen
+    df = max_distances.reindex(
+        index=pd.MultiIndex.from_frame(periods[row_keys].drop_duplicates()),
+        columns=periods['Threshold'].unique()
+    )
+    df.columns.name = None
+
+    return df.reset_index().drop(columns='Result')
 
-def create_binned_data_sheets(all_results: List[Dict[str, Any]], writer: pd.ExcelWriter):
+
+def create_binned_data_sheets(all_results: List[Dict[str, Any]], writer: pd.ExcelWriter,
+                              periods: Optional[pd.DataFrame] = None):
     """
     Create binned data sheets for each epoch duration
     """
-    # Group data by epoch duration
-    epoch_groups = {}
+    if periods is None:
+        periods = flatten_rolling_wcs_periods(all_results)
     
-    for result in all_results:
-        if not result.get('analysis_successful', False):
-            continue
-            
-        metadata = result.get('metadata', {})
-        player_name = metadata.get('player_name', 'Unknown')
+    # One sheet per epoch duration, in the order the durations were first seen
+    for epoch_duration, group in periods.groupby('Epoch_Duration', sort=False):
+        # A zero-length epoch cannot be binned - put its periods in the first bin
+        if epoch_duration > 0:
+            epoch_bins = (group['Start_Time'] / epoch_duration).astype(int) + 1
+        else:
+            epoch_bins = 1
+        df = pd.DataFrame({
+            'PLAYER_METADATA': group['PLAYER_METADATA'],
+            'Epoch': epoch_bins
+        })
         
-        wcs_results = result.get('wcs_results', {})
-        rolling_wcs = wcs_results.get('rolling_wcs', [])
+        # Each threshold seen in this bin gets its Distance/Time/Frequency columns;
+        # rows of the other threshold are left blank
+        frequency = 60.0 / epoch_duration if epoch_duration > 0 else 0
+        for threshold_num in group['Threshold_Num'].unique():
+            is_threshold = group['Threshold_Num'] == threshold_num
+            df[f'Distance_TH_{threshold_num}'] = group['Distance'].where(is_threshold)
+            df[f'Time_TH_{threshold_num}'] = np.where(is_threshold, epoch_duration, np.nan)
+            df[f'Frequency_TH_{threshold_num}'] = np.where(is_threshold, frequency, np.nan)
         
-        for wcs_period in rolling_wcs:
-            epoch_duration = wcs_period.get('epoch_duration', 0)
-            threshold_name = wcs_period.get('threshold_name', 'Default Threshold')
-            distance = wcs_period.get('distance', 0)
-            start_time_wcs = wcs_period.get('start_time', 0)
-            
-            if epoch_duration not in epoch_groups:
-                epoch_groups[epoch_duration] = []
-            
-            if 'Default' in threshold_name:
-                threshold_num = 0
-            elif 'Threshold 1' in threshold_name:
-                threshold_num = 1
-            else:
-                threshold_num = 0
-            
-            epoch_groups[epoch_duration].append({
-                'PLAYER_METADATA': player_name,
-                'Epoch': int(start_time_wcs / epoch_duration) + 1,
-                f'Distance_TH_{threshold_num}': distance,
-                f'Time_TH_{threshold_num}': epoch_duration,
-                f'Frequency_TH_{threshold_num}': 60.0 / epoch_duration if epoch_duration > 0 else 0
-            })
-    
-    # Create sheets for each epoch duration
-    for epoch_duration, data in epoch_groups.items():
-        if data:
-            df = pd.DataFrame(data)
-            
-            # Reorder columns
-            column_order = ['PLAYER_METADATA', 'Epoch']
-            for col in df.columns:
-                if col not in column_order:
-                    column_order.append(col)
-            
-            df = df[column_order]
-            
-            # Create sheet name
-            sheet_name = f"{epoch_duration:.1f} minute Bin"
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+        # Create sheet name
+        sheet_name = f"{epoch_duration:.1f} minute Bin"
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
 
 
 def export_to_csv_matlab_format(
@@ -8,10 +8,44 @@ and validation.
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, Tuple, Optional, Any
+from typing import Dict, List, Sequence, Tuple, Optional, Any
 import streamlit as st
 import re
 import os
+import json
+import hashlib
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Parsed CSV data is cached as Feather here, outside the user's data folders
+CSV_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'wcs')
+CSV_CACHE_VERSION = 2
+# Least recently used Feather files are evicted once they grow past this size
+CSV_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Columns the WCS analysis actually uses once a file has been standardised
+ANALYSIS_COLUMNS = ('Seconds', 'Velocity')
+
+# Raw StatSport columns and their standard names
+STATSPORT_COLUMN_MAPPING = {
+    ' Time': 'Timestamp',
+    ' Elapsed Time (s)': 'Seconds',
+    '  Speed m/s': 'Velocity',  # StatSport format with two leading spaces
+    ' Speed m/s': 'Velocity',   # StatSport format with one leading space
+    'Speed m/s': 'Velocity',    # Alternative format
+    'Speed': 'Velocity',        # Generic speed column
+    ' Lat': 'Latitude',
+    ' Lon': 'Longitude'
+}
+
+# Raw StatSport columns the metadata is built from
+STATSPORT_METADATA_COLUMNS = ('Player Id', ' Player Display Name', ' Elapsed Time (s)')
 
 
 def detect_file_format(content_lines: list) -> Dict[str, Any]:
@@ -46,6 +80,124 @@ def detect_file_format(content_lines: list) -> Dict[str, Any]:
     return {'type': 'unknown', 'confidence': 0.0}
 
 
+def get_csv_cache_path(file_path: str, skip_rows: int = 0,
+                       columns: Optional[List[str]] = None) -> str:
+    """
+    Build the Feather cache path for a CSV file
+
+    The name is keyed on the file's absolute path, modification time and size,
+    the parse options and the cache version, so editing the CSV (or reading it
+    differently) never hits a stale cache.
+
+    Args:
+        file_path: Path to the CSV file
+        skip_rows: Number of metadata lines before the column header
+        columns: Optional subset of columns read from the file
+
+    Returns:
+        Path of the cache file in CSV_CACHE_DIR
+    """
+    stat = os.stat(file_path)
+    key = json.dumps([CSV_CACHE_VERSION, os.path.abspath(file_path), stat.st_mtime, stat.st_size,
+                      skip_rows, list(columns) if columns is not None else None])
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(CSV_CACHE_DIR, f"{digest}.feather")
+
+
+def prune_csv_cache(max_bytes: int = CSV_CACHE_MAX_BYTES) -> None:
+    """
+    Evict the least recently used Feather files until they fit in max_bytes
+
+    Only *.feather files are counted, so the analysis results cached in the
+    same folder keep their own limit.
+
+    Args:
+        max_bytes: Maximum total size of the Feather files in CSV_CACHE_DIR
+    """
+    try:
+        entries = []
+        for entry in os.scandir(CSV_CACHE_DIR):
+            if entry.name.endswith('.feather'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+def read_csv_data_with_pyarrow(file_path: str, skip_rows: int = 0,
+                               columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Read the data portion of a CSV file with pyarrow's multi-threaded parser
+
+    The parsed table is cached as LZ4-compressed Feather in CSV_CACHE_DIR, so
+    re-reading an unchanged file skips CSV parsing entirely.
+
+    Args:
+        file_path: Path to the CSV file
+        skip_rows: Number of metadata lines before the column header
+        columns: Optional subset of columns to read (all columns if None). When
+            given, Velocity is parsed as float32, as the pandas path downcasts it.
+
+    Returns:
+        DataFrame with the parsed data, or None if pyarrow is unavailable or parsing fails
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+
+    try:
+        cache_path = get_csv_cache_path(file_path, skip_rows, columns)
+        # Open the cache directly - a missing file is just another OSError,
+        # so there is no separate exists() stat
+        try:
+            cached = pa_feather.read_table(cache_path)
+            # Touch the entry so eviction treats it as recently used
+            os.utime(cache_path)
+            return cached.to_pandas(self_destruct=True, split_blocks=True)
+        except (pa.ArrowInvalid, OSError):
+            pass  # No cache yet or unreadable - parse the CSV
+
+        # Keep timestamps as text (as pandas does); velocity only becomes compact
+        # float32 on the projected path, matching the pandas fallback
+        column_types = {'Timestamp': pa.string(), ' Time': pa.string()}
+        if columns is not None:
+            column_types['Velocity'] = pa.float32()
+
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(skip_rows=skip_rows, block_size=8 << 20),
+            # Match pandas' on_bad_lines='skip'
+            parse_options=pa_csv.ParseOptions(delimiter=',',
+                                              invalid_row_handler=lambda row: 'skip'),
+            convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                                  include_columns=columns)
+        )
+
+        try:
+            os.makedirs(CSV_CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so a concurrent reader never sees a partial cache
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            pa_feather.write_feather(table, temp_path, compression='lz4')
+            os.replace(temp_path, cache_path)
+            prune_csv_cache()
+        except OSError:
+            pass  # Unwritable cache folder - caching is best effort
+
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    except (pa.ArrowInvalid, OSError):
+        return None
+
+
 def read_statsport_file(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optional[Dict]]:
     """
     Read StatSport format CSV file
@@ -222,12 +374,16 @@ def read_catapult_file(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optional[
         return None, None
 
 
-def read_catapult_file_from_path(file_path: str) -> Tuple[Optional[pd.DataFrame], Optional[Dict]]:
+def read_catapult_file_from_path(
+    file_path: str,
+    needed_cols: Optional[Sequence[str]] = None
+) -> Tuple[Optional[pd.DataFrame], Optional[Dict]]:
     """
     Read Catapult format CSV file from file path
     
     Args:
         file_path: Path to the CSV file
+        needed_cols: Optional subset of columns to read (all columns if None)
         
     Returns:
         Tuple of (DataFrame, metadata_dict)
@@ -304,21 +460,32 @@ def read_catapult_file_from_path(file_path: str) -> Tuple[Optional[pd.DataFrame]
                     data_start = i
                     break
         
-        # Read data portion with proper CSV parsing
-        data_content = '\n'.join(lines[data_start:])
-        from io import StringIO
+        # Only parse the requested columns that are present in the header
+        columns = None
+        if needed_cols is not None:
+            header = [name.strip().strip('"') for name in lines[data_start].split(',')]
+            columns = [col for col in needed_cols if col in header]
+
+        # Read data portion - pyarrow parses large exports much faster when installed
+        df = read_csv_data_with_pyarrow(file_path, skip_rows=data_start, columns=columns)
         
-        # Use pandas with proper error handling
-        try:
-            df = pd.read_csv(StringIO(data_content), on_bad_lines='skip')
-        except Exception as csv_error:
-            st.error(f"CSV parsing error: {str(csv_error)}")
-            # Try alternative parsing
+        if df is None:
+            # Read data portion with proper CSV parsing
+            data_content = '\n'.join(lines[data_start:])
+            from io import StringIO
+
+            # Use pandas with proper error handling
             try:
-                df = pd.read_csv(StringIO(data_content), on_bad_lines='skip', engine='python')
-            except Exception as alt_error:
-                st.error(f"Alternative parsing also failed: {str(alt_error)}")
-                return None, None
+                df = pd.read_csv(StringIO(data_content), on_bad_lines='skip', usecols=columns)
+            except Exception as csv_error:
+                st.error(f"CSV parsing error: {str(csv_error)}")
+                # Try alternative parsing
+                try:
+                    df = pd.read_csv(StringIO(data_content), on_bad_lines='skip', engine='python',
+                                     usecols=columns)
+                except Exception as alt_error:
+                    st.error(f"Alternative parsing also failed: {str(alt_error)}")
+                    return None, None
         
         metadata['total_records'] = len(df)
         metadata['duration_minutes'] = df['Seconds'].max() / 60 if 'Seconds' in df.columns else 0
@@ -331,12 +498,17 @@ def read_catapult_file_from_path(file_path: str) -> Tuple[Optional[pd.DataFrame]
         return None, None
 
 
-def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optional[Dict], Optional[Dict]]:
+def read_csv_with_metadata(
+    uploaded_file,
+    needed_cols: Optional[Sequence[str]] = None
+) -> Tuple[Optional[pd.DataFrame], Optional[Dict], Optional[Dict]]:
     """
     Universal CSV reader with format detection
     
     Args:
         uploaded_file: Streamlit uploaded file or file path string
+        needed_cols: Optional subset of standardised columns to keep (e.g. ANALYSIS_COLUMNS).
+            Velocity is downcast to float32. All columns are kept if None.
         
     Returns:
         Tuple of (DataFrame, metadata_dict, file_type_info)
@@ -380,8 +552,18 @@ def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optio
         # Read based on detected format
         if file_type_info['type'] == 'statsport':
             if isinstance(uploaded_file, str):
-                # File path - read with pandas directly
-                df = pd.read_csv(uploaded_file)
+                # File path - only parse the metadata columns and the raw columns
+                # behind the requested ones, with pyarrow when installed
+                columns = None
+                if needed_cols is not None:
+                    header = [name.strip('\r\n').strip('"') for name in lines[0].split(',')]
+                    columns = [col for col in header
+                               if col in STATSPORT_METADATA_COLUMNS
+                               or STATSPORT_COLUMN_MAPPING.get(col, col) in needed_cols]
+
+                df = read_csv_data_with_pyarrow(uploaded_file, columns=columns)
+                if df is None:
+                    df = pd.read_csv(uploaded_file, usecols=columns)
                 
                 # Get player name from file data or fallback to filename
                 file_player_name = df[' Player Display Name'].iloc[0] if ' Player Display Name' in df.columns else None
@@ -407,17 +589,7 @@ def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optio
                 }
                 
                 # Rename columns to standard format
-                column_mapping = {
-                    ' Time': 'Timestamp',
-                    ' Elapsed Time (s)': 'Seconds',
-                    '  Speed m/s': 'Velocity',  # StatSport format with two leading spaces
-                    ' Speed m/s': 'Velocity',   # StatSport format with one leading space
-                    'Speed m/s': 'Velocity',    # Alternative format
-                    'Speed': 'Velocity',        # Generic speed column
-                    ' Lat': 'Latitude',
-                    ' Lon': 'Longitude'
-                }
-                df = df.rename(columns=column_mapping)
+                df = df.rename(columns=STATSPORT_COLUMN_MAPPING)
             else:
                 # File object - use StringIO to recreate file-like object
                 from io import StringIO
@@ -436,7 +608,7 @@ def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optio
         elif file_type_info['type'] in ['catapult', 'catapult_export']:
             if isinstance(uploaded_file, str):
                 # File path - read with pandas and handle metadata
-                df, metadata = read_catapult_file_from_path(uploaded_file)
+                df, metadata = read_catapult_file_from_path(uploaded_file, needed_cols)
                 
                 # Update metadata with filename information
                 if metadata:
@@ -473,7 +645,16 @@ def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optio
         else:
             # Generic CSV reader
             if isinstance(uploaded_file, str):
-                df = pd.read_csv(uploaded_file)
+                # Only parse the requested columns, with pyarrow (and its Feather cache)
+                # when installed
+                columns = None
+                if needed_cols is not None:
+                    header = [name.strip('\r\n').strip('"') for name in lines[0].split(',')]
+                    columns = [col for col in needed_cols if col in header]
+
+                df = read_csv_data_with_pyarrow(uploaded_file, columns=columns)
+                if df is None:
+                    df = pd.read_csv(uploaded_file, usecols=columns)
             else:
                 # Use StringIO to recreate file-like object
                 from io import StringIO
@@ -496,6 +677,12 @@ def read_csv_with_metadata(uploaded_file) -> Tuple[Optional[pd.DataFrame], Optio
                 'filename_pattern': filename_info['filename_pattern']
             }
         
+        # Drop columns the caller does not need and halve the velocity footprint
+        if df is not None and needed_cols is not None:
+            df = df[[col for col in needed_cols if col in df.columns]]
+            if 'Velocity' in df.columns and pd.api.types.is_float_dtype(df['Velocity']):
+                df = df.astype({'Velocity': 'float32'})
+
         # Show actual data content preview after processing
         if df is not None and not df.empty:
             st.write(f"📊 Processed data preview:")
@@ -564,6 +751,42 @@ def validate_velocity_data(df: pd.DataFrame) -> bool:
         return False 
 
 
+def list_csv_files(folder: str) -> List[str]:
+    """
+    List the CSV files directly inside a folder
+
+    Uses a single os.scandir pass, whose entries already carry the file
+    type, instead of a stat call per listed name.
+
+    Args:
+        folder: Folder to list
+
+    Returns:
+        List of CSV file names (without the folder prefix)
+    """
+    with os.scandir(folder) as entries:
+        return [entry.name for entry in entries
+                if entry.name[-4:].lower() == '.csv' and entry.is_file(follow_symlinks=False)]
+
+
+def list_csv_files_with_sizes(folder: str) -> List[Tuple[str, int]]:
+    """
+    List the CSV files directly inside a folder together with their sizes
+
+    Sizes are read from the same os.scandir pass that finds the files, so
+    totalling a folder does not need a second walk or os.path.getsize calls.
+
+    Args:
+        folder: Folder to list
+
+    Returns:
+        List of (file name, size in bytes) tuples
+    """
+    with os.scandir(folder) as entries:
+        return [(entry.name, entry.stat(follow_symlinks=False).st_size) for entry in entries
+                if entry.name[-4:].lower() == '.csv' and entry.is_file(follow_symlinks=False)]
+
+
 def extract_player_info_from_filename(filename: str) -> Dict[str, str]:
     """
     Extract player information from filename following various patterns:
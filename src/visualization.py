@@ -5,15 +5,89 @@ Handles creation of interactive charts and graphs for GPS data analysis.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List
 import streamlit as st
 
+# Series longer than this are decimated before plotting the time series
+DECIMATION_THRESHOLD = 20000
+MAX_PLOT_POINTS = 10000
 
-def add_wcs_annotations(fig, wcs_results, colors, annotation_positions):
+
+def decimate_min_max(velocity_data: np.ndarray, max_points: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Select sample indices that keep the shape of a long velocity series
+
+    Splits the series into equal buckets and keeps the minimum and maximum
+    sample of each, plus the first and last samples, so sprint peaks and the
+    session's time span survive the reduction to at most max_points samples.
+
+    Args:
+        velocity_data: Array of velocity values
+        max_points: Maximum number of samples to keep (at least 4)
+
+    Returns:
+        Sorted array of sample indices to plot
+    """
+    velocity_data = np.asarray(velocity_data, dtype=np.float64)
+    n_samples = len(velocity_data)
+    if n_samples <= max_points:
+        return np.arange(n_samples)
+
+    # Two samples per bucket, with room left for the first and last samples
+    n_buckets = max((max_points - 2) // 2, 1)
+    bucket_size = -(-n_samples // n_buckets)
+    padding = (-n_samples) % bucket_size
+    buckets = np.pad(velocity_data, (0, padding), constant_values=np.nan).reshape(-1, bucket_size)
+    missing = np.isnan(buckets)
+    offsets = np.arange(buckets.shape[0]) * bucket_size
+
+    low = np.argmin(np.where(missing, np.inf, buckets), axis=1) + offsets
+    high = np.argmax(np.where(missing, -np.inf, buckets), axis=1) + offsets
+    indices = np.unique(np.concatenate([[0, n_samples - 1], low, high]))
+    return indices[indices < n_samples]
+
+
+# Where add_vrect places a label for each annotation_position: which edge of
+# the rectangle (0 = x0, 1 = x1), its x anchor, its y (axis domain) and y anchor
+VRECT_ANNOTATION_ANCHORS = {
+    'top left': (0, 'left', 1, 'top'),
+    'top right': (1, 'right', 1, 'top'),
+    'bottom left': (0, 'left', 0, 'bottom'),
+    'bottom right': (1, 'right', 0, 'bottom'),
+}
+
+
+def append_layout_items(fig, shapes=(), annotations=()):
+    """
+    Append shapes and annotations to a figure's layout in a single update
+
+    add_shape/add_vrect re-validate the whole shapes (and annotations) tuple
+    on every call, and add_vrect also scans the subplots each time, so adding
+    highlights one at a time grows quadratically. Building plain dicts and
+    assigning them once validates each item exactly once.
+
+    Args:
+        fig: Plotly figure object
+        shapes: Shape dicts to append
+        annotations: Annotation dicts to append
+
+    Returns:
+        Updated figure
+    """
+    updates = {}
+    if shapes:
+        updates['shapes'] = fig.layout.shapes + tuple(shapes)
+    if annotations:
+        updates['annotations'] = fig.layout.annotations + tuple(annotations)
+    if updates:
+        fig.update_layout(**updates)
+    return fig
+
+
+def add_wcs_annotations(fig, wcs_results, colors, annotation_positions, rows=1):
     """
     Add WCS annotations with intelligent positioning to avoid overlaps
     
@@ -22,6 +96,7 @@ def add_wcs_annotations(fig, wcs_results, colors, annotation_positions):
         wcs_results: List of WCS results
         colors: List of colors for different epochs
         annotation_positions: List of annotation positions to cycle through
+        rows: Number of stacked subplot rows each period spans
         
     Returns:
         Updated figure with annotations
@@ -32,6 +107,41 @@ def add_wcs_annotations(fig, wcs_results, colors, annotation_positions):
     # Valid Plotly annotation positions
     valid_positions = ['top left', 'top right', 'bottom left', 'bottom right']
     
+    label_style = dict(
+        font=dict(size=10, color="white"),
+        bgcolor="rgba(0,0,0,0.8)",
+        bordercolor="rgba(255,255,255,0.3)",
+        borderwidth=1,
+        showarrow=False
+    )
+
+    # Full-height labelled rectangles on every subplot row, laid out as add_vrect
+    # would, collected and appended in one layout update
+    axis_suffixes = [''] + [str(row) for row in range(2, rows + 1)]
+    shapes = []
+    annotations = []
+
+    def add_period(x0, x1, color, opacity, text, position):
+        edge, xanchor, y, yanchor = VRECT_ANNOTATION_ANCHORS[position]
+        for suffix in axis_suffixes:
+            shapes.append(dict(
+                type="rect",
+                x0=x0, x1=x1,
+                y0=0, y1=1,
+                xref=f"x{suffix}", yref=f"y{suffix} domain",
+                fillcolor=color,
+                opacity=opacity,
+                layer="below",
+                line=dict(width=0)
+            ))
+            annotations.append(dict(
+                text=text,
+                x=x1 if edge else x0, xanchor=xanchor,
+                y=y, yanchor=yanchor,
+                xref=f"x{suffix}", yref=f"y{suffix} domain",
+                **label_style
+            ))
+
     for i, epoch_result in enumerate(wcs_results):
         if len(epoch_result) >= 8:
             # Default threshold period
@@ -42,21 +152,8 @@ def add_wcs_annotations(fig, wcs_results, colors, annotation_positions):
             # Choose position to avoid overlap (use only valid positions)
             th0_pos = valid_positions[i % len(valid_positions)]
             
-            fig.add_vrect(
-                x0=th0_start, x1=th0_end,
-                fillcolor=colors[i % len(colors)],
-                opacity=0.2,
-                layer="below",
-                line_width=0,
-                annotation_text=f"Default: {th0_distance:.1f}m",
-                annotation_position=th0_pos,
-                annotation=dict(
-                    font=dict(size=10, color="white"),
-                    bgcolor="rgba(0,0,0,0.8)",
-                    bordercolor="rgba(255,255,255,0.3)",
-                    borderwidth=1
-                )
-            )
+            add_period(th0_start, th0_end, colors[i % len(colors)], 0.2,
+                       f"Default: {th0_distance:.1f}m", th0_pos)
             
             # Threshold 1 period
             th1_start = epoch_result[6] / 10
@@ -66,23 +163,10 @@ def add_wcs_annotations(fig, wcs_results, colors, annotation_positions):
             # Choose different position for Threshold 1 to avoid overlap
             th1_pos = valid_positions[(i + 2) % len(valid_positions)]
             
-            fig.add_vrect(
-                x0=th1_start, x1=th1_end,
-                fillcolor=colors[(i + 1) % len(colors)],
-                opacity=0.3,
-                layer="below",
-                line_width=0,
-                annotation_text=f"Threshold 1: {th1_distance:.1f}m",
-                annotation_position=th1_pos,
-                annotation=dict(
-                    font=dict(size=10, color="white"),
-                    bgcolor="rgba(0,0,0,0.8)",
-                    bordercolor="rgba(255,255,255,0.3)",
-                    borderwidth=1
-                )
-            )
+            add_period(th1_start, th1_end, colors[(i + 1) % len(colors)], 0.3,
+                       f"Threshold 1: {th1_distance:.1f}m", th1_pos)
     
-    return fig
+    return append_layout_items(fig, shapes, annotations)
 
 
 def create_kinematic_visualization(df: pd.DataFrame, 
@@ -136,11 +220,15 @@ def create_kinematic_visualization(df: pd.DataFrame,
         else:
             time_data = np.arange(len(df)) / 10  # Assume 10Hz
         
+        # Long sessions are drawn with WebGL - SVG line traces slow the browser
+        # down as the point count grows
+        scatter = go.Scattergl if len(df) > DECIMATION_THRESHOLD else go.Scatter
+
         current_row = 1
         
         # Velocity plot
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=time_data,
                 y=df['Velocity'],
                 mode='lines',
@@ -154,7 +242,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
         # Add smoothed velocity if available
         if 'Velocity_Smooth' in df.columns:
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=time_data,
                     y=df['Velocity_Smooth'],
                     mode='lines',
@@ -170,7 +258,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
         # Acceleration plot
         if has_acceleration:
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=time_data,
                     y=df['Acceleration'],
                     mode='lines',
@@ -184,7 +272,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
             # Add smoothed acceleration if available
             if 'Acceleration_Smooth' in df.columns:
                 fig.add_trace(
-                    go.Scatter(
+                    scatter(
                         x=time_data,
                         y=df['Acceleration_Smooth'],
                         mode='lines',
@@ -202,7 +290,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
         # Distance plot
         if has_distance:
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=time_data,
                     y=df['Distance'],
                     mode='lines',
@@ -217,7 +305,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
         # Power plot
         if has_power:
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=time_data,
                     y=df['Power'],
                     mode='lines',
@@ -231,7 +319,7 @@ def create_kinematic_visualization(df: pd.DataFrame,
         # Add WCS periods to velocity plot if available
         if wcs_results:
             colors = ['red', 'orange', 'green', 'purple', 'brown']
-            fig = add_wcs_annotations(fig, wcs_results, colors, [])
+            fig = add_wcs_annotations(fig, wcs_results, colors, [], rows=num_plots)
         
         # Update layout with better spacing
         fig.update_layout(
@@ -327,11 +415,22 @@ def create_velocity_visualization(df: pd.DataFrame,
         else:
             time_data = np.arange(len(df)) / 10  # Assume 10Hz
         
+        velocity_data = df['Velocity'].to_numpy()
+        time_data = np.asarray(time_data)
+
+        # Long series are decimated and drawn with WebGL to keep the figure light
+        scatter = go.Scatter
+        if len(df) > DECIMATION_THRESHOLD:
+            indices = decimate_min_max(velocity_data)
+            time_data = time_data[indices]
+            velocity_data = velocity_data[indices]
+            scatter = go.Scattergl
+
         # Add velocity time series
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=time_data,
-                y=df['Velocity'],
+                y=velocity_data,
                 mode='lines',
                 name='Velocity',
                 line=dict(color='blue', width=1),
@@ -345,11 +444,15 @@ def create_velocity_visualization(df: pd.DataFrame,
             colors = ['red', 'orange', 'green', 'purple', 'brown']
             fig = add_wcs_annotations(fig, wcs_results, colors, [])
         
-        # Add velocity distribution histogram
+        # Add velocity distribution histogram - binned here so the figure carries
+        # 50 counts instead of every (undecimated) velocity sample
+        all_velocities = df['Velocity'].to_numpy(dtype=np.float64)
+        counts, edges = np.histogram(all_velocities[np.isfinite(all_velocities)], bins=50)
         fig.add_trace(
-            go.Histogram(
-                x=df['Velocity'],
-                nbinsx=50,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name='Velocity Distribution',
                 marker_color='lightblue',
                 opacity=0.7,
@@ -484,6 +587,84 @@ def create_dual_wcs_velocity_visualization(df: pd.DataFrame,
         return None
 
 
+def build_wcs_period_segments(wcs_results, distance_index, start_index, base_height):
+    """
+    Build one gap-separated line covering a threshold's WCS period in every epoch
+
+    Each period becomes a horizontal segment from its start to its end sample,
+    raised by its distance (scaled into a 2 m/s band above base_height). A NaN
+    point after every segment breaks the line, so all epochs fit in one trace.
+
+    Args:
+        wcs_results: WCS results, one entry per epoch
+        distance_index: Position of the distance in each epoch result
+        start_index: Position of the start sample (the end sample follows it)
+        base_height: Bottom of the velocity band the segments are drawn in
+
+    Returns:
+        Tuple of (x, y, customdata) arrays; customdata rows are
+        (distance, start seconds, end seconds)
+    """
+    periods = np.array([epoch_result[:8] for epoch_result in wcs_results if len(epoch_result) >= 8],
+                       dtype=np.float64).reshape(-1, 8)
+    distance = periods[:, distance_index]
+    start = periods[:, start_index] / 10  # Convert to seconds
+    end = periods[:, start_index + 1] / 10
+    height = base_height + (distance / 1000) * 2.0
+    gap = np.full(len(periods), np.nan)
+
+    x = np.column_stack([start, end, gap]).ravel()
+    y = np.column_stack([height, height, gap]).ravel()
+    customdata = np.repeat(np.column_stack([distance, start, end]), 3, axis=0)
+    return x, y, customdata
+
+
+def add_wcs_period_curves(fig, wcs_results, method_label, colors, dash, symbol):
+    """
+    Add a method's WCS periods as one scaled curve per threshold
+
+    Args:
+        fig: Plotly figure object
+        wcs_results: WCS results, one entry per epoch
+        method_label: Method name used in the legend ('Rolling' or 'Contiguous')
+        colors: Colors keyed by 'th0' and 'th1'
+        dash: Line dash style
+        symbol: Marker symbol
+
+    Returns:
+        Updated figure with the WCS curves
+    """
+    # Default threshold sits in the 7-9 m/s band, Threshold 1 in the 5-7 m/s band
+    thresholds = (('th0', 'Default', 'Default Threshold', 0, 2, 7.0),
+                  ('th1', 'Threshold 1', 'Threshold 1', 4, 6, 5.0))
+
+    for key, short_name, full_name, distance_index, start_index, base_height in thresholds:
+        x, y, customdata = build_wcs_period_segments(wcs_results, distance_index, start_index,
+                                                     base_height)
+        if len(x) == 0:
+            continue
+
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=y,
+                customdata=customdata,
+                mode='lines+markers',
+                name=f'{method_label} {short_name}',
+                line=dict(color=colors[key], width=6, dash=dash),
+                marker=dict(size=10, color=colors[key], symbol=symbol),
+                hovertemplate=(f'<b>{method_label} {full_name}</b>'
+                               '<br>Distance: %{customdata[0]:.1f}m'
+                               '<br>Time: %{customdata[1]:.1f}s - %{customdata[2]:.1f}s'
+                               '<extra></extra>'),
+                showlegend=True,
+                legendgroup=f'{method_label.lower()}_{key}'
+            )
+        )
+
+    return fig
+
+
 def add_rolling_wcs_curves(fig, rolling_wcs_results, time_data, velocity_data):
     """
     Add rolling WCS periods as scaled curves on the velocity plot
@@ -501,62 +682,7 @@ def add_rolling_wcs_curves(fig, rolling_wcs_results, time_data, velocity_data):
         'th0': '#FF6B6B',  # Red for Default threshold
         'th1': '#4ECDC4'   # Teal for Threshold 1
     }
-    
-    # Get velocity range for scaling - use fixed 0-10 range for consistent scaling
-    vel_max = 10.0  # Fixed maximum for y-axis
-    vel_min = 0.0   # Fixed minimum for y-axis
-    vel_range = vel_max - vel_min
-    
-    for i, epoch_result in enumerate(rolling_wcs_results):
-        if len(epoch_result) >= 8:
-            # Default threshold period
-            th0_start = epoch_result[2] / 10  # Convert to seconds
-            th0_end = epoch_result[3] / 10
-            th0_distance = epoch_result[0]
-            
-            # Create scaled curve for Default threshold
-            # Scale the distance to fit within 0-10 range
-            # Position at 7-9 m/s range for good visibility
-            scaled_height = 7.0 + (th0_distance / 1000) * 2.0  # Scale to fit in 7-9 range
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[th0_start, th0_end],
-                    y=[scaled_height, scaled_height],
-                    mode='lines+markers',
-                    name=f'Rolling Default ({th0_distance:.1f}m)',
-                    line=dict(color=colors['th0'], width=6, dash='solid'),  # Increased width
-                    marker=dict(size=10, color=colors['th0']),  # Increased size
-                    hovertemplate=f'<b>Rolling Default Threshold</b><br>Distance: {th0_distance:.1f}m<br>Time: {th0_start:.1f}s - {th0_end:.1f}s<extra></extra>',
-                    showlegend=True,
-                    legendgroup='rolling_th0'
-                )
-            )
-            
-            # Threshold 1 period
-            th1_start = epoch_result[6] / 10
-            th1_end = epoch_result[7] / 10
-            th1_distance = epoch_result[4]
-            
-            # Create scaled curve for Threshold 1
-            # Position at 5-7 m/s range for good visibility
-            scaled_height_th1 = 5.0 + (th1_distance / 1000) * 2.0  # Scale to fit in 5-7 range
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[th1_start, th1_end],
-                    y=[scaled_height_th1, scaled_height_th1],
-                    mode='lines+markers',
-                    name=f'Rolling Threshold 1 ({th1_distance:.1f}m)',
-                    line=dict(color=colors['th1'], width=6, dash='solid'),  # Increased width
-                    marker=dict(size=10, color=colors['th1']),  # Increased size
-                    hovertemplate=f'<b>Rolling Threshold 1</b><br>Distance: {th1_distance:.1f}m<br>Time: {th1_start:.1f}s - {th1_end:.1f}s<extra></extra>',
-                    showlegend=True,
-                    legendgroup='rolling_th1'
-                )
-            )
-    
-    return fig
+    return add_wcs_period_curves(fig, rolling_wcs_results, 'Rolling', colors, 'solid', 'circle')
 
 
 def add_contiguous_wcs_curves(fig, contiguous_wcs_results, time_data, velocity_data):
@@ -576,62 +702,8 @@ def add_contiguous_wcs_curves(fig, contiguous_wcs_results, time_data, velocity_d
         'th0': '#FF8E8E',  # Lighter red for Default threshold
         'th1': '#6EDDD6'   # Lighter teal for Threshold 1
     }
-    
-    # Get velocity range for scaling - use fixed 0-10 range for consistent scaling
-    vel_max = 10.0  # Fixed maximum for y-axis
-    vel_min = 0.0   # Fixed minimum for y-axis
-    vel_range = vel_max - vel_min
-    
-    for i, epoch_result in enumerate(contiguous_wcs_results):
-        if len(epoch_result) >= 8:
-            # Default threshold period
-            th0_start = epoch_result[2] / 10  # Convert to seconds
-            th0_end = epoch_result[3] / 10
-            th0_distance = epoch_result[0]
-            
-            # Create scaled curve for Default threshold
-            # Scale the distance to fit within 0-10 range
-            # Position at 7-9 m/s range for good visibility
-            scaled_height = 7.0 + (th0_distance / 1000) * 2.0  # Scale to fit in 7-9 range
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[th0_start, th0_end],
-                    y=[scaled_height, scaled_height],
-                    mode='lines+markers',
-                    name=f'Contiguous Default ({th0_distance:.1f}m)',
-                    line=dict(color=colors['th0'], width=6, dash='dot'),  # Increased width
-                    marker=dict(size=10, color=colors['th0'], symbol='diamond'),  # Increased size
-                    hovertemplate=f'<b>Contiguous Default Threshold</b><br>Distance: {th0_distance:.1f}m<br>Time: {th0_start:.1f}s - {th0_end:.1f}s<extra></extra>',
-                    showlegend=True,
-                    legendgroup='contiguous_th0'
-                )
-            )
-            
-            # Threshold 1 period
-            th1_start = epoch_result[6] / 10
-            th1_end = epoch_result[7] / 10
-            th1_distance = epoch_result[4]
-            
-            # Create scaled curve for Threshold 1
-            # Position at 5-7 m/s range for good visibility
-            scaled_height_th1 = 5.0 + (th1_distance / 1000) * 2.0  # Scale to fit in 5-7 range
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[th1_start, th1_end],
-                    y=[scaled_height_th1, scaled_height_th1],
-                    mode='lines+markers',
-                    name=f'Contiguous Threshold 1 ({th1_distance:.1f}m)',
-                    line=dict(color=colors['th1'], width=6, dash='dot'),  # Increased width
-                    marker=dict(size=10, color=colors['th1'], symbol='diamond'),  # Increased size
-                    hovertemplate=f'<b>Contiguous Threshold 1</b><br>Distance: {th1_distance:.1f}m<br>Time: {th1_start:.1f}s - {th1_end:.1f}s<extra></extra>',
-                    showlegend=True,
-                    legendgroup='contiguous_th1'
-                )
-            )
-    
-    return fig
+    return add_wcs_period_curves(fig, contiguous_wcs_results, 'Contiguous', colors,
+                                 'dot', 'diamond')
 
 
 def create_wcs_comparison_chart(wcs_results: List[List], 
@@ -651,30 +723,27 @@ def create_wcs_comparison_chart(wcs_results: List[List],
         th0_distances = [result[0] for result in wcs_results]
         th1_distances = [result[4] for result in wcs_results]
         
-        # Create figure
-        fig = go.Figure()
+        epoch_labels = [f"{dur:.1f}min" for dur in epoch_durations]
         
-        # Add Default threshold distances
-        fig.add_trace(
+        # Create figure with both threshold series in one construction
+        fig = go.Figure(data=[
+            # Default threshold distances
             go.Bar(
-                x=[f"{dur:.1f}min" for dur in epoch_durations],
+                x=epoch_labels,
                 y=th0_distances,
                 name='Default Threshold Distance',
                 marker_color='lightcoral',
                 hovertemplate='Epoch: %{x}<br>Distance: %{y:.1f} m<extra></extra>'
-            )
-        )
-        
-        # Add Threshold 1 distances
-        fig.add_trace(
+            ),
+            # Threshold 1 distances
             go.Bar(
-                x=[f"{dur:.1f}min" for dur in epoch_durations],
+                x=epoch_labels,
                 y=th1_distances,
                 name='Threshold 1 Distance',
                 marker_color='lightblue',
                 hovertemplate='Epoch: %{x}<br>Distance: %{y:.1f} m<extra></extra>'
             )
-        )
+        ])
         
         # Update layout
         fig.update_layout(
@@ -1060,44 +1129,47 @@ def add_enhanced_wcs_periods(fig, wcs_results, time_data, row=1):
     y_min = 0
     y_max = 10  # Set to 10 m/s as requested
     
+    # Collected and appended in one layout update rather than one add_shape per period
+    shapes = []
+
     for i, epoch_result in enumerate(wcs_results):
         if len(epoch_result) >= 8:
             # Default threshold period - clean background highlight only
             th0_start = epoch_result[2] / 10
             th0_end = epoch_result[3] / 10
             
-            # Use add_shape instead of add_vrect for better control
-            fig.add_shape(
+            # Explicit rectangles instead of add_vrect for better control
+            shapes.append(dict(
                 type="rect",
                 x0=th0_start, x1=th0_end,
                 y0=y_min, y1=y_max,
                 fillcolor=colors['th0'],
                 opacity=0.15,  # Very subtle background
                 layer="below",
-                line_width=0,  # No border
+                line=dict(width=0),  # No border
                 visible=True,
                 xref=f"x{row}" if row > 1 else "x",
                 yref=f"y{row}" if row > 1 else "y"
-            )
+            ))
             
             # Threshold 1 period - clean background highlight only
             th1_start = epoch_result[6] / 10
             th1_end = epoch_result[7] / 10
             
-            fig.add_shape(
+            shapes.append(dict(
                 type="rect",
                 x0=th1_start, x1=th1_end,
                 y0=y_min, y1=y_max,
                 fillcolor=colors['th1'],
                 opacity=0.2,  # Slightly more visible
                 layer="below",
-                line_width=0,  # No border
+                line=dict(width=0),  # No border
                 visible=True,
                 xref=f"x{row}" if row > 1 else "x",
                 yref=f"y{row}" if row > 1 else "y"
-            )
+            ))
     
-    return fig
+    return append_layout_items(fig, shapes)
 
 
 def create_wcs_timeline(fig, wcs_results, row=2):
@@ -1208,8 +1280,12 @@ def create_performance_intensity(fig, df, wcs_results, row=3):
     time_data = df['Seconds'] if 'Seconds' in df.columns else np.arange(len(df)) / 10
     velocity_data = df['Velocity']
     
-    # Normalize velocity to intensity (0-1)
-    intensity = (velocity_data - velocity_data.min()) / (velocity_data.max() - velocity_data.min())
+    # Normalize velocity to intensity (0-1) in one numpy pass; a constant
+    # series maps to 0 rather than dividing by a zero range
+    velocity_values = velocity_data.to_numpy(dtype=np.float64)
+    velocity_min = np.nanmin(velocity_values)
+    velocity_range = np.nanmax(velocity_values) - velocity_min
+    intensity = (velocity_values - velocity_min) / (velocity_range if velocity_range > 0 else 1.0)
     
     # Add clean intensity trace
     fig.add_trace(
@@ -1234,43 +1310,46 @@ def create_performance_intensity(fig, df, wcs_results, row=3):
     y_min = 0
     y_max = 1  # Intensity is normalized to 0-1
     
+    # Collected and appended in one layout update rather than one add_shape per period
+    shapes = []
+
     for i, epoch_result in enumerate(wcs_results):
         if len(epoch_result) >= 8:
             # Default threshold intensity highlight
             th0_start = epoch_result[2] / 10
             th0_end = epoch_result[3] / 10
             
-            fig.add_shape(
+            shapes.append(dict(
                 type="rect",
                 x0=th0_start, x1=th0_end,
                 y0=y_min, y1=y_max,
                 fillcolor=colors_wcs['th0'],
                 opacity=0.1,  # Very subtle
                 layer="below",
-                line_width=0,
+                line=dict(width=0),
                 visible=True,
                 xref=f"x{row}" if row > 1 else "x",
                 yref=f"y{row}" if row > 1 else "y"
-            )
+            ))
             
             # Threshold 1 intensity highlight
             th1_start = epoch_result[6] / 10
             th1_end = epoch_result[7] / 10
             
-            fig.add_shape(
+            shapes.append(dict(
                 type="rect",
                 x0=th1_start, x1=th1_end,
                 y0=y_min, y1=y_max,
                 fillcolor=colors_wcs['th1'],
                 opacity=0.1,  # Very subtle
                 layer="below",
-                line_width=0,
+                line=dict(width=0),
                 visible=True,
                 xref=f"x{row}" if row > 1 else "x",
                 yref=f"y{row}" if row > 1 else "y"
-            )
+            ))
     
-    return fig
+    return append_layout_items(fig, shapes)
 
 
 def create_wcs_period_details(wcs_results: List[List], epoch_durations: Optional[List[float]] = None, wcs_method: str = 'rolling') -> pd.DataFrame:
@@ -9,6 +9,27 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 import streamlit as st
+import os
+import json
+import pickle
+import hashlib
+
+try:
+    from wcs_fast import NUMBA_AVAILABLE, rolling_wcs, summary_stats
+except ImportError:
+    from src.wcs_fast import NUMBA_AVAILABLE, rolling_wcs, summary_stats
+
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# On-disk cache of analysis results; bump the version when the result layout changes
+RESULTS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'wcs')
+RESULTS_CACHE_VERSION = 2
+# Least recently used results are evicted once the cache grows past this size
+RESULTS_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
 
 def calculate_acceleration(velocity_data: np.ndarray, sampling_rate: int = 10) -> np.ndarray:
@@ -149,6 +170,30 @@ def calculate_kinematic_parameters(velocity_data: np.ndarray, sampling_rate: int
         return {}
 
 
+def process_velocity_array(velocity_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clean a raw velocity column into the array the WCS scans run on
+
+    Floating-point input keeps its dtype. Anything else is parsed with
+    pd.to_numeric and stored as float32, which halves the bytes fed to the
+    WCS scans compared with the float64 pandas would produce.
+
+    Args:
+        velocity_data: Raw velocity values (any numeric or text dtype)
+
+    Returns:
+        Tuple of (velocity values with missing values removed, mask of the
+        input rows that were kept)
+    """
+    velocity_data = pd.Series(velocity_data)
+    if pd.api.types.is_float_dtype(velocity_data):
+        velocity_data = velocity_data.to_numpy()
+    else:
+        velocity_data = pd.to_numeric(velocity_data, errors='coerce').to_numpy(dtype=np.float32)
+    valid = ~np.isnan(velocity_data)
+    return velocity_data[valid], valid
+
+
 def process_velocity_data(df: pd.DataFrame, sampling_rate: int = 10) -> pd.DataFrame:
     """
     Process velocity data to 10Hz sampling rate and calculate kinematic parameters
@@ -166,49 +211,140 @@ def process_velocity_data(df: pd.DataFrame, sampling_rate: int = 10) -> pd.DataF
             st.error("Velocity column not found in data")
             return df
         
-        # Create time index if not present
-        if 'Seconds' not in df.columns:
-            # Create time index based on row number and sampling rate
-            df['Seconds'] = np.arange(len(df)) / sampling_rate
-        
-        # Ensure velocity data is numeric
-        df['Velocity'] = pd.to_numeric(df['Velocity'], errors='coerce')
+        velocity_data, valid = process_velocity_array(df['Velocity'])
         
-        # Remove any NaN values
-        df = df.dropna(subset=['Velocity'])
-        
-        # Reset index for clean processing
-        df = df.reset_index(drop=True)
+        # Keep any other columns for the rows that still have a velocity value
+        other_columns = [col for col in df.columns if col not in ('Seconds', 'Velocity')]
+        columns = {col: df[col].to_numpy()[valid] for col in other_columns}
         
         # Create standardized time index
-        df['Seconds'] = np.arange(len(df)) / sampling_rate
+        columns['Seconds'] = np.arange(len(velocity_data)) / sampling_rate
+        columns['Velocity'] = velocity_data
         
         # Calculate kinematic parameters
-        velocity_data = df['Velocity'].values
         kinematic_params = calculate_kinematic_parameters(velocity_data, sampling_rate)
         
         # Add kinematic parameters to DataFrame
         if kinematic_params:
-            df['Acceleration'] = kinematic_params['acceleration']
-            df['Deceleration'] = kinematic_params['deceleration']
-            df['Distance'] = kinematic_params['distance']
-            df['Power'] = kinematic_params['power']
-            df['Jerk'] = kinematic_params['jerk']
-            df['Velocity_Smooth'] = kinematic_params['velocity_smooth']
-            df['Acceleration_Smooth'] = kinematic_params['acceleration_smooth']
-        
-        return df
+            columns['Acceleration'] = kinematic_params['acceleration']
+            columns['Deceleration'] = kinematic_params['deceleration']
+            columns['Distance'] = kinematic_params['distance']
+            columns['Power'] = kinematic_params['power']
+            columns['Jerk'] = kinematic_params['jerk']
+            columns['Velocity_Smooth'] = kinematic_params['velocity_smooth']
+            columns['Acceleration_Smooth'] = kinematic_params['acceleration_smooth']
+
+        # Build the frame once, in the input's column order, instead of copying it per step
+        order = list(df.columns) + [col for col in columns if col not in df.columns]
+        return pd.DataFrame({col: columns[col] for col in order})
         
     except Exception as e:
         st.error(f"Error processing velocity data: {str(e)}")
         return df
 
 
+def apply_velocity_threshold(velocity_data: np.ndarray,
+                             threshold_min: float,
+                             threshold_max: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Zero out velocity samples outside the threshold range
+
+    Args:
+        velocity_data: Array of velocity values
+        threshold_min: Minimum velocity threshold
+        threshold_max: Maximum velocity threshold
+
+    Returns:
+        Tuple of (masked_velocity, threshold_mask)
+    """
+    velocity_data = np.asarray(velocity_data)
+    threshold_mask = (velocity_data >= threshold_min) & (velocity_data <= threshold_max)
+    masked_velocity = np.where(threshold_mask, velocity_data, velocity_data.dtype.type(0))
+    return masked_velocity, threshold_mask
+
+
+def _scan_windows(velocity_data: np.ndarray,
+                  epoch_samples: int,
+                  n_windows: int,
+                  sampling_rate: int,
+                  threshold_min: float,
+                  threshold_max: float,
+                  threshold_mask: Optional[np.ndarray] = None) -> Tuple[float, float, int, int]:
+    """
+    Find the WCS window among the first n_windows start positions
+
+    Uses the numba running-sum kernel when available, otherwise derives every
+    window sum from a single cumulative sum.
+
+    Args:
+        velocity_data: Array of velocity values
+        epoch_samples: Window length in samples
+        n_windows: Number of window start positions to scan
+        sampling_rate: Sampling rate in Hz
+        threshold_min: Minimum velocity threshold
+        threshold_max: Maximum velocity threshold
+        threshold_mask: Optional mask from apply_velocity_threshold; when given,
+            velocity_data is the matching already-masked velocity
+
+    Returns:
+        Tuple of (max_distance, max_time, start_index, end_index)
+    """
+    if epoch_samples == 0 or n_windows <= 0:
+        return 0, 0, 0, 0
+
+    if threshold_mask is not None:
+        # Already thresholded - every sample counts as-is
+        masked_velocity = velocity_data
+        threshold_min, threshold_max = -np.inf, np.inf
+    else:
+        masked_velocity = None
+
+    if NUMBA_AVAILABLE:
+        best_sum, best = rolling_wcs(velocity_data, epoch_samples, n_windows,
+                                     float(threshold_min), float(threshold_max))
+    else:
+        if masked_velocity is None:
+            # Apply velocity threshold once - data points outside the range contribute nothing
+            masked_velocity, threshold_mask = apply_velocity_threshold(velocity_data, threshold_min,
+                                                                       threshold_max)
+
+        # Window sums as differences of one cumulative sum - a single O(N) pass
+        # instead of re-reducing every overlapping window
+        cumulative = np.empty(len(masked_velocity) + 1, dtype=np.float64)
+        cumulative[0] = 0.0
+        np.cumsum(np.ascontiguousarray(masked_velocity), dtype=np.float64, out=cumulative[1:])
+        window_distances = (cumulative[epoch_samples:epoch_samples + n_windows]
+                            - cumulative[:n_windows])
+
+        # First window with the highest distance (matches a strict '>' scan)
+        best = int(np.argmax(window_distances))
+        best_sum = window_distances[best]
+
+    if best_sum <= 0:
+        return 0, 0, 0, 0
+
+    # Each sample represents 1/sampling_rate seconds
+    time_per_sample = 1.0 / sampling_rate
+    if threshold_mask is not None:
+        in_threshold = np.count_nonzero(threshold_mask[best:best + epoch_samples])
+    else:
+        window_data = velocity_data[best:best + epoch_samples]
+        in_threshold = np.count_nonzero((window_data >= threshold_min)
+                                        & (window_data <= threshold_max))
+
+    max_distance = float(best_sum * time_per_sample)
+    max_time = float(in_threshold * time_per_sample)
+
+    return max_distance, max_time, int(best), int(best) + epoch_samples
+
+
 def calculate_wcs_period_rolling(velocity_data: np.ndarray, 
                                 epoch_duration: float, 
                                 sampling_rate: int = 10,
                                 threshold_min: float = 0.0,
-                                threshold_max: float = 100.0) -> Tuple[float, float, int, int]:
+                                threshold_max: float = 100.0,
+                                threshold_mask: Optional[np.ndarray] = None
+                                ) -> Tuple[float, float, int, int]:
     """
     Calculate WCS period using rolling window approach with central point focus
     
@@ -224,66 +360,39 @@ def calculate_wcs_period_rolling(velocity_data: np.ndarray,
         sampling_rate: Sampling rate in Hz
         threshold_min: Minimum velocity threshold
         threshold_max: Maximum velocity threshold
+        threshold_mask: Optional precomputed mask from apply_velocity_threshold; when given,
+            velocity_data must be the matching masked velocity
         
     Returns:
         Tuple of (max_distance, max_time, start_index, end_index)
     """
-    try:
-        # Convert epoch duration to samples
-        epoch_samples = int(epoch_duration * 60 * sampling_rate)
-        
-        if len(velocity_data) < epoch_samples:
-            # If data is shorter than epoch, use all available data
-            epoch_samples = len(velocity_data)
-        
-        # Calculate cumulative distance for each window
-        max_distance = 0
-        max_time = 0
-        start_index = 0
-        end_index = 0
-        
-        # Calculate half-window size for central point focus
-        half_window = epoch_samples // 2
-        
-        # Slide window through data with central point focus
-        for i in range(half_window, len(velocity_data) - half_window):
-            # Window is centered on point i
-            window_start = i - half_window
-            window_end = i + half_window + (1 if epoch_samples % 2 == 1 else 0)  # Handle odd window sizes
-            
-            window_data = velocity_data[window_start:window_end]
-            
-            # Apply velocity threshold - only include data points within threshold range
-            threshold_mask = (window_data >= threshold_min) & (window_data <= threshold_max)
-            window_data_thresholded = window_data[threshold_mask]
-            
-            # Calculate distance for this window (velocity * time)
-            # Each sample represents 1/sampling_rate seconds
-            time_per_sample = 1.0 / sampling_rate
-            window_distance = np.sum(window_data_thresholded * time_per_sample)
-            
-            # Calculate time within threshold
-            window_time = len(window_data_thresholded) * time_per_sample
-            
-            # Update maximum if this window has higher distance AND has data within threshold
-            if window_distance > max_distance and len(window_data_thresholded) > 0:
-                max_distance = window_distance
-                max_time = window_time
-                start_index = window_start
-                end_index = window_end
-        
-        return max_distance, max_time, start_index, end_index
-        
-    except Exception as e:
-        st.error(f"Error calculating WCS period (rolling): {str(e)}")
-        return 0.0, 0.0, 0, 0
+    velocity_data = np.asarray(velocity_data)
+
+    # Convert epoch duration to samples
+    epoch_samples = int(epoch_duration * 60 * sampling_rate)
+
+    if len(velocity_data) < epoch_samples:
+        # If data is shorter than epoch, use all available data
+        epoch_samples = len(velocity_data)
+
+    # Calculate half-window size for central point focus
+    half_window = epoch_samples // 2
+
+    # Windows are centred on points half_window .. len - half_window - 1, so the
+    # window starts run from 0 up to (but excluding) len - 2 * half_window
+    n_windows = len(velocity_data) - 2 * half_window
+
+    return _scan_windows(velocity_data, epoch_samples, n_windows, sampling_rate,
+                         threshold_min, threshold_max, threshold_mask)
 
 
 def calculate_wcs_period_contiguous(velocity_data: np.ndarray, 
                                    epoch_duration: float, 
                                    sampling_rate: int = 10,
                                    threshold_min: float = 0.0,
-                                   threshold_max: float = 100.0) -> Tuple[float, float, int, int]:
+                                   threshold_max: float = 100.0,
+                                   threshold_mask: Optional[np.ndarray] = None
+                                   ) -> Tuple[float, float, int, int]:
     """
     Calculate WCS period using contiguous epoch approach
     
@@ -296,52 +405,26 @@ def calculate_wcs_period_contiguous(velocity_data: np.ndarray,
         sampling_rate: Sampling rate in Hz
         threshold_min: Minimum velocity threshold
         threshold_max: Maximum velocity threshold
+        threshold_mask: Optional precomputed mask from apply_velocity_threshold; when given,
+            velocity_data must be the matching masked velocity
         
     Returns:
         Tuple of (max_distance, max_time, start_index, end_index)
     """
-    try:
-        # Convert epoch duration to samples
-        epoch_samples = int(epoch_duration * 60 * sampling_rate)
-        
-        if len(velocity_data) < epoch_samples:
-            # If data is shorter than epoch, use all available data
-            epoch_samples = len(velocity_data)
-        
-        # Apply velocity threshold
-        threshold_mask = (velocity_data >= threshold_min) & (velocity_data <= threshold_max)
-        
-        # Calculate cumulative distance for each window
-        max_distance = 0
-        max_time = 0
-        start_index = 0
-        end_index = 0
-        
-        # Slide window through data to find best contiguous period
-        for i in range(len(velocity_data) - epoch_samples + 1):
-            window_data = velocity_data[i:i + epoch_samples]
-            window_mask = threshold_mask[i:i + epoch_samples]
-            
-            # Calculate distance for this window (velocity * time)
-            # Each sample represents 1/sampling_rate seconds
-            time_per_sample = 1.0 / sampling_rate
-            window_distance = np.sum(window_data[window_mask] * time_per_sample)
-            
-            # Calculate time within threshold
-            window_time = np.sum(window_mask) * time_per_sample
-            
-            # Update maximum if this window has higher distance
-            if window_distance > max_distance:
-                max_distance = window_distance
-                max_time = window_time
-                start_index = i
-                end_index = i + epoch_samples
-        
-        return max_distance, max_time, start_index, end_index
-        
-    except Exception as e:
-        st.error(f"Error calculating WCS period (contiguous): {str(e)}")
-        return 0.0, 0.0, 0, 0
+    velocity_data = np.asarray(velocity_data)
+
+    # Convert epoch duration to samples
+    epoch_samples = int(epoch_duration * 60 * sampling_rate)
+
+    if len(velocity_data) < epoch_samples:
+        # If data is shorter than epoch, use all available data
+        epoch_samples = len(velocity_data)
+
+    # Every start position whose window fits inside the data
+    n_windows = len(velocity_data) - epoch_samples + 1
+
+    return _scan_windows(velocity_data, epoch_samples, n_windows, sampling_rate,
+                         threshold_min, threshold_max, threshold_mask)
 
 
 def calculate_wcs_period(velocity_data: np.ndarray, 
@@ -349,7 +432,9 @@ def calculate_wcs_period(velocity_data: np.ndarray,
                         sampling_rate: int = 10,
                         threshold_min: float = 0.0,
                         threshold_max: float = 100.0,
-                        method: str = 'rolling') -> Tuple[float, float, int, int]:
+                        method: str = 'rolling',
+                        threshold_mask: Optional[np.ndarray] = None
+                        ) -> Tuple[float, float, int, int]:
     """
     Calculate WCS period for given epoch duration and threshold
     
@@ -360,14 +445,18 @@ def calculate_wcs_period(velocity_data: np.ndarray,
         threshold_min: Minimum velocity threshold
         threshold_max: Maximum velocity threshold
         method: Analysis method - 'rolling' or 'contiguous'
+        threshold_mask: Optional precomputed mask from apply_velocity_threshold; when given,
+            velocity_data must be the matching masked velocity
         
     Returns:
         Tuple of (max_distance, max_time, start_index, end_index)
     """
     if method == 'contiguous':
-        return calculate_wcs_period_contiguous(velocity_data, epoch_duration, sampling_rate, threshold_min, threshold_max)
+        return calculate_wcs_period_contiguous(velocity_data, epoch_duration, sampling_rate,
+                                               threshold_min, threshold_max, threshold_mask)
     else:
-        return calculate_wcs_period_rolling(velocity_data, epoch_duration, sampling_rate, threshold_min, threshold_max)
+        return calculate_wcs_period_rolling(velocity_data, epoch_duration, sampling_rate,
+                                            threshold_min, threshold_max, threshold_mask)
 
 
 def perform_wcs_analysis(df: pd.DataFrame, metadata: Dict[str, Any], file_type_info: Dict[str, Any], parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -398,12 +487,18 @@ def perform_wcs_analysis(df: pd.DataFrame, metadata: Dict[str, Any], file_type_i
         # Extract velocity data
         velocity_data = processed_df['Velocity'].values
         
-        # Calculate velocity statistics
+        # Calculate velocity statistics (one fused pass when numba is available)
+        if NUMBA_AVAILABLE and len(velocity_data) > 0:
+            velocity_min, velocity_max, velocity_mean, velocity_std = summary_stats(velocity_data)
+        else:
+            velocity_min, velocity_max = np.min(velocity_data), np.max(velocity_data)
+            velocity_mean, velocity_std = np.mean(velocity_data), np.std(velocity_data)
+
         velocity_stats = {
-            'mean': float(np.mean(velocity_data)),
-            'max': float(np.max(velocity_data)),
-            'min': float(np.min(velocity_data)),
-            'std': float(np.std(velocity_data)),
+            'mean': float(velocity_mean),
+            'max': float(velocity_max),
+            'min': float(velocity_min),
+            'std': float(velocity_std),
             'total_samples': len(velocity_data),
             'duration_seconds': len(velocity_data) / sampling_rate
         }
@@ -472,42 +567,36 @@ def perform_wcs_analysis(df: pd.DataFrame, metadata: Dict[str, Any], file_type_i
         rolling_wcs_results = []
         contiguous_wcs_results = []
         
-        for epoch_duration in epoch_durations:
-            # Calculate WCS for Default threshold (rolling)
-            th0_distance_rolling, th0_time_rolling, th0_start_rolling, th0_end_rolling = calculate_wcs_period(
-                velocity_data, epoch_duration, sampling_rate, th0_min, th0_max, 'rolling'
-            )
-            
-            # Calculate WCS for Threshold 1 (rolling)
-            th1_distance_rolling, th1_time_rolling, th1_start_rolling, th1_end_rolling = calculate_wcs_period(
-                velocity_data, epoch_duration, sampling_rate, th1_min, th1_max, 'rolling'
-            )
-            
-            # Calculate WCS for Default threshold (contiguous)
-            th0_distance_contiguous, th0_time_contiguous, th0_start_contiguous, th0_end_contiguous = calculate_wcs_period(
-                velocity_data, epoch_duration, sampling_rate, th0_min, th0_max, 'contiguous'
+        # Threshold the velocity once per threshold and share it across all epoch durations
+        th0_velocity, th0_mask = apply_velocity_threshold(velocity_data, th0_min, th0_max)
+        th1_velocity, th1_mask = apply_velocity_threshold(velocity_data, th1_min, th1_max)
+
+        # Every (epoch, threshold, method) scan is independent. The numba kernel and
+        # NumPy reductions release the GIL, so threads share the masked arrays without copies
+        scans = [
+            (thX_velocity, epoch_duration, sampling_rate, thX_min, thX_max, method, thX_mask)
+            for epoch_duration in epoch_durations
+            for method in ('rolling', 'contiguous')
+            for thX_velocity, thX_min, thX_max, thX_mask in (
+                (th0_velocity, th0_min, th0_max, th0_mask),
+                (th1_velocity, th1_min, th1_max, th1_mask)
             )
-            
-            # Calculate WCS for Threshold 1 (contiguous)
-            th1_distance_contiguous, th1_time_contiguous, th1_start_contiguous, th1_end_contiguous = calculate_wcs_period(
-                velocity_data, epoch_duration, sampling_rate, th1_min, th1_max, 'contiguous'
+        ]
+        if JOBLIB_AVAILABLE and len(epoch_durations) > 1:
+            periods = Parallel(n_jobs=-1, prefer='threads')(
+                delayed(calculate_wcs_period)(*scan) for scan in scans
             )
+        else:
+            periods = [calculate_wcs_period(*scan) for scan in scans]
+
+        for i, epoch_duration in enumerate(epoch_durations):
+            th0_rolling, th1_rolling, th0_contiguous, th1_contiguous = periods[4 * i:4 * i + 4]
             
-            # Store rolling results for this epoch
-            rolling_epoch_results = [
-                th0_distance_rolling, th0_time_rolling, th0_start_rolling, th0_end_rolling,
-                th1_distance_rolling, th1_time_rolling, th1_start_rolling, th1_end_rolling,
-                epoch_duration
-            ]
-            rolling_wcs_results.append(rolling_epoch_results)
+            # Store rolling results for this epoch (Default threshold, then Threshold 1)
+            rolling_wcs_results.append([*th0_rolling, *th1_rolling, epoch_duration])
             
             # Store contiguous results for this epoch
-            contiguous_epoch_results = [
-                th0_distance_contiguous, th0_time_contiguous, th0_start_contiguous, th0_end_contiguous,
-                th1_distance_contiguous, th1_time_contiguous, th1_start_contiguous, th1_end_contiguous,
-                epoch_duration
-            ]
-            contiguous_wcs_results.append(contiguous_epoch_results)
+            contiguous_wcs_results.append([*th0_contiguous, *th1_contiguous, epoch_duration])
         
         # Prepare final results
         results = {
@@ -529,6 +618,111 @@ def perform_wcs_analysis(df: pd.DataFrame, metadata: Dict[str, Any], file_type_i
         return None
 
 
+def get_results_cache_path(file_path: str, parameters: Dict[str, Any]) -> str:
+    """
+    Build the results cache path for a file analysed with the given parameters
+
+    The name is keyed on the file's absolute path, modification time and size
+    and the analysis parameters, so editing the file or changing a parameter
+    never hits a stale entry.
+
+    Args:
+        file_path: Path to the analysed CSV file
+        parameters: Analysis parameters dictionary
+
+    Returns:
+        Path of the pickle file in RESULTS_CACHE_DIR
+    """
+    stat = os.stat(file_path)
+    key = json.dumps([RESULTS_CACHE_VERSION, os.path.abspath(file_path),
+                      stat.st_mtime, stat.st_size, parameters],
+                     sort_keys=True, default=str)
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(RESULTS_CACHE_DIR, f"{digest}.pkl")
+
+
+def load_cached_results(file_path: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load previously saved analysis results for a file, if any
+
+    Args:
+        file_path: Path to the analysed CSV file
+        parameters: Analysis parameters dictionary
+
+    Returns:
+        Cached results dictionary with file_name and file_path set, or None if
+        there is no usable cache entry
+    """
+    try:
+        cache_path = get_results_cache_path(file_path, parameters)
+        with open(cache_path, 'rb') as f:
+            results = pickle.load(f)
+        # Touch the entry so eviction treats it as recently used
+        os.utime(cache_path)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    # Entries hold only the analysis output - the file keys depend on the caller
+    results['file_name'] = os.path.basename(file_path)
+    results['file_path'] = file_path
+    return results
+
+
+def prune_results_cache(max_bytes: int = RESULTS_CACHE_MAX_BYTES) -> None:
+    """
+    Evict the least recently used cache entries until the cache fits in max_bytes
+
+    Args:
+        max_bytes: Maximum total size of the pickle files in RESULTS_CACHE_DIR
+    """
+    try:
+        entries = []
+        for entry in os.scandir(RESULTS_CACHE_DIR):
+            if entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+def save_cached_results(file_path: str, parameters: Dict[str, Any],
+                        results: Dict[str, Any]) -> None:
+    """
+    Save analysis results so re-analysing an unchanged file is a cache read
+
+    Args:
+        file_path: Path to the analysed CSV file
+        parameters: Analysis parameters dictionary
+        results: Results dictionary from perform_wcs_analysis
+    """
+    # file_name/file_path are added back by load_cached_results, so every
+    # caller gets the same entry whatever keys it attached
+    results = {key: value for key, value in results.items()
+               if key not in ('file_name', 'file_path')}
+    try:
+        cache_path = get_results_cache_path(file_path, parameters)
+        os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees a partial pickle
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        return  # Caching is best effort
+
+    prune_results_cache()
+
+
 def calculate_summary_statistics(rolling_wcs_results: List[List], contiguous_wcs_results: List[List]) -> Dict[str, Any]:
     """
     Calculate summary statistics from both rolling and contiguous WCS results
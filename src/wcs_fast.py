@@ -0,0 +1,101 @@
+"""
+Fast WCS Kernels for WCS Analysis Platform
+
+Numba-compiled window scans used by the WCS analysis module when numba
+is installed. Without numba the analysis falls back to NumPy reductions.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def rolling_wcs(velocity_data: np.ndarray,
+                window: int,
+                n_windows: int,
+                threshold_min: float,
+                threshold_max: float) -> Tuple[float, int]:
+    """
+    Find the window with the largest thresholded velocity sum in one pass
+
+    Keeps a running sum that adds the sample entering the window and drops
+    the sample leaving it, so no per-window array is ever allocated. The GIL
+    is released, so scans for different epochs can run on parallel threads.
+
+    Args:
+        velocity_data: Array of velocity values
+        window: Window length in samples
+        n_windows: Number of window start positions to scan (from index 0)
+        threshold_min: Minimum velocity threshold
+        threshold_max: Maximum velocity threshold
+
+    Returns:
+        Tuple of (best_sum, best_start) for the first window with the highest sum
+    """
+    running_sum = 0.0
+    for i in range(window):
+        x = velocity_data[i]
+        if threshold_min <= x <= threshold_max:
+            running_sum += x
+
+    best_sum = running_sum
+    best_start = 0
+
+    for start in range(1, n_windows):
+        x_in = velocity_data[start + window - 1]
+        if threshold_min <= x_in <= threshold_max:
+            running_sum += x_in
+        x_out = velocity_data[start - 1]
+        if threshold_min <= x_out <= threshold_max:
+            running_sum -= x_out
+
+        if running_sum > best_sum:
+            best_sum = running_sum
+            best_start = start
+
+    return best_sum, best_start
+
+
+@njit(cache=True, nogil=True)
+def summary_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute min, max, mean and standard deviation in a single pass
+
+    Sums are taken relative to the first value (shifted data) so the
+    one-pass variance stays accurate for offset-heavy signals.
+
+    Args:
+        values: Non-empty array of values
+
+    Returns:
+        Tuple of (min, max, mean, std) with the population standard deviation
+    """
+    shift = float(values[0])
+    lo = values[0]
+    hi = values[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(len(values)):
+        x = values[i]
+        lo = min(lo, x)
+        hi = max(hi, x)
+        d = float(x) - shift
+        total += d
+        total_sq += d * d
+
+    n = len(values)
+    mean = total / n
+    variance = max(total_sq / n - mean * mean, 0.0)
+    return float(lo), float(hi), shift + mean, np.sqrt(variance)
@@ -9,7 +9,7 @@ import pandas as pd
 from pathlib import Path
 
 # Add src to path
-sys.path.append('src')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 def test_file_ingestion():
     """Test the file ingestion functionality"""
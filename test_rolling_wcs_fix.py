@@ -9,7 +9,7 @@ import sys
 import os
 
 # Add src to path
-sys.path.append('src')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 from wcs_analysis import calculate_wcs_period_rolling
 
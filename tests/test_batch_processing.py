@@ -0,0 +1,151 @@
+"""
+Test file for batch processing module
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import the module to test
+import sys
+sys.path.append('src')
+import batch_processing
+import wcs_analysis
+
+
+class TestResultsCache:
+    """Test cases for the on-disk results cache used when re-analysing files"""
+
+    @pytest.fixture
+    def session_file(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary folder and stub out reading and analysis"""
+        monkeypatch.setattr(wcs_analysis, 'RESULTS_CACHE_DIR', str(tmp_path / 'cache'))
+
+        self.analysis_calls = 0
+
+        def fake_read_csv_with_metadata(file_input, columns):
+            df = pd.DataFrame({'Seconds': np.arange(10) / 10, 'Velocity': np.full(10, 3.0)})
+            return df, {'player_name': 'Player'}, {'type': 'statsport'}
+
+        def fake_perform_wcs_analysis(df, metadata, file_type_info, parameters):
+            self.analysis_calls += 1
+            return {'metadata': metadata, 'parameters': parameters, 'rolling_wcs_results': []}
+
+        monkeypatch.setattr(batch_processing, 'read_csv_with_metadata', fake_read_csv_with_metadata)
+        monkeypatch.setattr(batch_processing, 'perform_wcs_analysis', fake_perform_wcs_analysis)
+
+        file_path = tmp_path / 'session.csv'
+        file_path.write_text('Seconds,Velocity\n0.0,3.0\n')
+        return str(file_path)
+
+    def test_hit_skips_analysis(self, session_file):
+        """A second run on an unchanged file reuses the saved results"""
+        parameters = {'epoch_duration': 1.0}
+
+        first = batch_processing.process_batch_files([session_file], parameters)
+        second = batch_processing.process_batch_files([session_file], parameters)
+
+        assert self.analysis_calls == 1
+        assert second[0]['rolling_wcs_results'] == first[0]['rolling_wcs_results']
+        assert second[0]['file_name'] == 'session.csv'
+
+    def test_modified_file_misses(self, session_file):
+        """Changing the file's modification time invalidates the entry"""
+        parameters = {'epoch_duration': 1.0}
+
+        batch_processing.process_batch_files([session_file], parameters)
+        mtime = os.path.getmtime(session_file)
+        os.utime(session_file, (mtime + 10, mtime + 10))
+        batch_processing.process_batch_files([session_file], parameters)
+
+        assert self.analysis_calls == 2
+
+    def test_changed_parameters_miss(self, session_file):
+        """Analysing with different parameters does not reuse the entry"""
+        batch_processing.process_batch_files([session_file], {'epoch_duration': 1.0})
+        batch_processing.process_batch_files([session_file], {'epoch_duration': 2.0})
+
+        assert self.analysis_calls == 2
+
+    def test_entry_saved_by_the_app_loads_in_a_batch(self, session_file):
+        """Raw perform_wcs_analysis output saved by the app is usable by the batch run"""
+        parameters = {'epoch_duration': 1.0}
+        wcs_analysis.save_cached_results(session_file, parameters,
+                                         {'metadata': {}, 'rolling_wcs_results': []})
+
+        results = batch_processing.process_batch_files([session_file], parameters)
+
+        assert self.analysis_calls == 0
+        assert results[0]['file_name'] == 'session.csv'
+        assert results[0]['file_path'] == session_file
+
+    def test_same_mtime_rewrite_misses(self, session_file):
+        """A rewrite within the same mtime tick still invalidates the entry by size"""
+        parameters = {'epoch_duration': 1.0}
+
+        batch_processing.process_batch_files([session_file], parameters)
+        mtime = os.path.getmtime(session_file)
+        with open(session_file, 'a') as f:
+            f.write('0.1,3.5\n')
+        os.utime(session_file, (mtime, mtime))
+        batch_processing.process_batch_files([session_file], parameters)
+
+        assert self.analysis_calls == 2
+
+    def test_prune_evicts_least_recently_used(self, session_file):
+        """Entries past the size cap are evicted oldest first"""
+        for epoch_duration in (1.0, 2.0, 3.0):
+            batch_processing.process_batch_files([session_file], {'epoch_duration': epoch_duration})
+
+        paths = [wcs_analysis.get_results_cache_path(session_file, {'epoch_duration': d})
+                 for d in (1.0, 2.0, 3.0)]
+        for age, path in zip((300, 200, 100), paths):
+            mtime = os.path.getmtime(path) - age
+            os.utime(path, (mtime, mtime))
+
+        wcs_analysis.prune_results_cache(max_bytes=os.path.getsize(paths[2]))
+
+        assert [os.path.exists(path) for path in paths] == [False, False, True]
+
+
+class TestCombinedResultsCache:
+    """Test cases for reusing the combined DataFrame and export outside Streamlit"""
+
+    @staticmethod
+    def make_result(file_name, epoch_duration=1.0):
+        return {
+            'file_name': file_name,
+            'metadata': {'player_name': file_name},
+            'parameters': {'epoch_duration': epoch_duration},
+            'rolling_wcs_results': [(10.0, 2.0, 0, 10, 8.0, 2.0, 0, 10)],
+        }
+
+    def test_key_changes_on_in_place_append(self):
+        """Appending to the same list gives a new key, so stale frames are not served"""
+        all_results = [self.make_result('a.csv')]
+        key = batch_processing.get_results_cache_key(all_results)
+
+        all_results.append(self.make_result('b.csv'))
+
+        assert batch_processing.get_results_cache_key(all_results) != key
+
+    def test_key_depends_on_parameters_not_identity(self):
+        """Equal batches share a key and different parameters do not"""
+        key = batch_processing.get_results_cache_key([self.make_result('a.csv')])
+
+        assert batch_processing.get_results_cache_key([self.make_result('a.csv')]) == key
+        assert batch_processing.get_results_cache_key([self.make_result('a.csv', 2.0)]) != key
+
+    def test_export_without_streamlit_session(self, tmp_path):
+        """The CSV export builds its own frame without touching session state"""
+        export_path = batch_processing.export_wcs_data_to_csv([self.make_result('a.csv')],
+                                                              output_folder=str(tmp_path))
+
+        assert export_path is not None
+        assert len(pd.read_csv(export_path)) > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
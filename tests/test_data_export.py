@@ -0,0 +1,168 @@
+"""
+Test file for data export module
+"""
+
+import pandas as pd
+import pytest
+
+# Import the module to test
+import sys
+sys.path.append('src')
+from data_export import (
+    create_binned_data_sheets,
+    create_summary_max_values_sheet,
+    flatten_rolling_wcs_periods
+)
+
+
+def threshold_number(threshold_name):
+    """Threshold numbering used by the MATLAB-format sheets"""
+    return 1 if 'Threshold 1' in threshold_name and 'Default' not in threshold_name else 0
+
+
+def reference_summary_max_values(all_results):
+    """Summary sheet built with the original per-file nested dictionaries"""
+    summary_data = []
+    for result in all_results:
+        if not result.get('analysis_successful', False):
+            continue
+        player_name = result.get('metadata', {}).get('player_name', 'Unknown')
+
+        epoch_data = {}
+        for wcs_period in result.get('wcs_results', {}).get('rolling_wcs', []):
+            thresholds = epoch_data.setdefault(wcs_period.get('epoch_duration', 0), {})
+            key = f"Distance_TH_{threshold_number(wcs_period.get('threshold_name', 'Default'))}"
+            thresholds.setdefault(key, []).append(wcs_period.get('distance', 0))
+
+        for epoch_duration, thresholds in epoch_data.items():
+            row_data = {'PLAYER_METADATA': player_name, 'Epoch': epoch_duration}
+            for key, distances in thresholds.items():
+                row_data[key] = max(distances)
+            summary_data.append(row_data)
+
+    if not summary_data:
+        return pd.DataFrame()
+    df = pd.DataFrame(summary_data)
+    column_order = ['PLAYER_METADATA', 'Epoch']
+    column_order += [col for col in df.columns if col not in column_order]
+    return df[column_order]
+
+
+def reference_binned_data(all_results):
+    """Binned sheets built with the original per-epoch lists of row dictionaries"""
+    epoch_groups = {}
+    for result in all_results:
+        if not result.get('analysis_successful', False):
+            continue
+        player_name = result.get('metadata', {}).get('player_name', 'Unknown')
+
+        for wcs_period in result.get('wcs_results', {}).get('rolling_wcs', []):
+            epoch_duration = wcs_period.get('epoch_duration', 0)
+            threshold_num = threshold_number(wcs_period.get('threshold_name', 'Default'))
+            epoch_groups.setdefault(epoch_duration, []).append({
+                'PLAYER_METADATA': player_name,
+                'Epoch': int(wcs_period.get('start_time', 0) / epoch_duration) + 1,
+                f'Distance_TH_{threshold_num}': wcs_period.get('distance', 0),
+                f'Time_TH_{threshold_num}': epoch_duration,
+                f'Frequency_TH_{threshold_num}': 60.0 / epoch_duration
+            })
+
+    return {f"{epoch_duration:.1f} minute Bin": pd.DataFrame(rows)
+            for epoch_duration, rows in epoch_groups.items()}
+
+
+@pytest.fixture
+def all_results():
+    """Three analysed files with three epochs and two thresholds, plus a failed file"""
+    results = []
+    for file_index, player_name in enumerate(['Player A', 'Player B', 'Player A']):
+        # The second file lists Threshold 1 first, so column order follows first appearance
+        thresholds = ['Default Threshold', 'Threshold 1']
+        if file_index == 1:
+            thresholds.reverse()
+
+        rolling_wcs = []
+        for epoch_index, epoch_duration in enumerate([1.0, 2.0, 5.0]):
+            for threshold_index, threshold_name in enumerate(thresholds):
+                for repeat in range(2):
+                    rolling_wcs.append({
+                        'epoch_duration': epoch_duration,
+                        'threshold_name': threshold_name,
+                        'distance': 100.0 + 37 * file_index + 11 * epoch_index
+                        + 5 * threshold_index - 3 * repeat,
+                        'start_time': 13.0 * (file_index + 1) * (epoch_index + 1) + repeat
+                    })
+
+        results.append({
+            'analysis_successful': True,
+            'metadata': {'player_name': player_name},
+            'wcs_results': {'rolling_wcs': rolling_wcs}
+        })
+
+    results.insert(1, {'analysis_successful': False, 'error': 'Failed to read file'})
+    return results
+
+
+@pytest.fixture
+def captured_sheets(monkeypatch):
+    """Capture the frames written by to_excel instead of writing a workbook"""
+    sheets = {}
+
+    def capture(df, writer, sheet_name, index=True):
+        sheets[sheet_name] = df.reset_index(drop=True)
+
+    monkeypatch.setattr(pd.DataFrame, 'to_excel', capture)
+    return sheets
+
+
+class TestMatlabFormatSheets:
+    """Check the flattened sheet builders against the original nested-dict code"""
+
+    def test_summary_max_values_matches_reference(self, all_results):
+        """Per-file, per-epoch maxima match row for row and column for column"""
+        expected = reference_summary_max_values(all_results)
+
+        pd.testing.assert_frame_equal(create_summary_max_values_sheet(all_results), expected)
+
+        periods = flatten_rolling_wcs_periods(all_results)
+        pd.testing.assert_frame_equal(create_summary_max_values_sheet(all_results, periods),
+                                      expected)
+
+    def test_binned_data_matches_reference(self, all_results, captured_sheets):
+        """Every epoch gets the same sheet, rows and columns as before"""
+        expected = reference_binned_data(all_results)
+
+        create_binned_data_sheets(all_results, writer=None)
+
+        assert list(captured_sheets) == list(expected)
+        for sheet_name, df in expected.items():
+            pd.testing.assert_frame_equal(captured_sheets[sheet_name], df)
+
+    def test_no_successful_results(self, captured_sheets):
+        """Only failed files give an empty summary and no binned sheets"""
+        failed = [{'analysis_successful': False}]
+
+        assert create_summary_max_values_sheet(failed).empty
+        create_binned_data_sheets(failed, writer=None)
+        assert captured_sheets == {}
+
+    def test_zero_epoch_duration(self, captured_sheets):
+        """A zero-length epoch is put in the first bin instead of dividing by zero"""
+        results = [{
+            'analysis_successful': True,
+            'metadata': {'player_name': 'Player A'},
+            'wcs_results': {'rolling_wcs': [
+                {'epoch_duration': 0, 'threshold_name': 'Default Threshold',
+                 'distance': 12.0, 'start_time': 30.0}
+            ]}
+        }]
+
+        create_binned_data_sheets(results, writer=None)
+
+        df = captured_sheets['0.0 minute Bin']
+        assert df['Epoch'].tolist() == [1]
+        assert df['Frequency_TH_0'].tolist() == [0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -19,6 +19,7 @@ from file_ingestion import (
     read_csv_with_metadata,
     validate_velocity_data
 )
+import file_ingestion
 
 
 class TestFileIngestion:
@@ -190,6 +191,110 @@ Timestamp,Velocity,Latitude,Longitude,Seconds
             os.unlink(temp_file)
 
 
+class TestCsvCache:
+    """Test cases for the Feather cache behind read_csv_data_with_pyarrow"""
+
+    CONTENT = """# OpenField Export
+# Athlete: John Doe
+Timestamp,Velocity,Seconds
+00:00:01,2.5,1
+00:00:02,3.1,2
+00:00:03,1.8,3"""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path, monkeypatch):
+        """Write a small Catapult-style CSV and point the cache at a temporary folder"""
+        if not file_ingestion.PYARROW_AVAILABLE:
+            pytest.skip("pyarrow is not installed")
+
+        monkeypatch.setattr(file_ingestion, 'CSV_CACHE_DIR', str(tmp_path / 'cache'))
+
+        self.parse_calls = 0
+        read_csv = file_ingestion.pa_csv.read_csv
+
+        def counting_read_csv(*args, **kwargs):
+            self.parse_calls += 1
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(file_ingestion.pa_csv, 'read_csv', counting_read_csv)
+
+        data_dir = tmp_path / 'data'
+        data_dir.mkdir()
+        file_path = data_dir / 'session.csv'
+        file_path.write_text(self.CONTENT)
+        return str(file_path)
+
+    def read(self, file_path, skip_rows=2):
+        return file_ingestion.read_csv_data_with_pyarrow(file_path, skip_rows=skip_rows,
+                                                         columns=['Velocity', 'Seconds'])
+
+    def test_hit_skips_parsing(self, csv_file):
+        """Re-reading an unchanged file comes from the cache"""
+        first = self.read(csv_file)
+        second = self.read(csv_file)
+
+        assert self.parse_calls == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert second['Velocity'].tolist() == pytest.approx([2.5, 3.1, 1.8])
+
+    def test_touched_file_misses(self, csv_file):
+        """Changing the file's modification time re-parses the CSV"""
+        self.read(csv_file)
+        mtime = os.path.getmtime(csv_file)
+        os.utime(csv_file, (mtime + 10, mtime + 10))
+        self.read(csv_file)
+
+        assert self.parse_calls == 2
+
+    def test_skip_rows_is_part_of_the_key(self, csv_file):
+        """Reading with a different header offset does not reuse the entry"""
+        assert file_ingestion.get_csv_cache_path(csv_file, 2) != \
+            file_ingestion.get_csv_cache_path(csv_file, 0)
+
+    def test_velocity_downcast_only_when_projected(self, csv_file):
+        """A full read keeps float64 velocity, as the pandas path does"""
+        full = file_ingestion.read_csv_data_with_pyarrow(csv_file, skip_rows=2)
+        projected = self.read(csv_file)
+
+        assert full['Velocity'].dtype == np.float64
+        assert projected['Velocity'].dtype == np.float32
+
+    def test_prune_evicts_least_recently_used(self, csv_file):
+        """Feather files past the size cap are evicted oldest first, other files are kept"""
+        column_sets = (['Velocity'], ['Seconds'], ['Velocity', 'Seconds'])
+        for columns in column_sets:
+            file_ingestion.read_csv_data_with_pyarrow(csv_file, skip_rows=2, columns=columns)
+        paths = [file_ingestion.get_csv_cache_path(csv_file, 2, columns)
+                 for columns in column_sets]
+        results_path = os.path.join(file_ingestion.CSV_CACHE_DIR, 'results.pkl')
+        with open(results_path, 'wb') as f:
+            f.write(b'x' * 100000)
+        for age, path in zip((300, 200, 100), paths):
+            mtime = os.path.getmtime(path) - age
+            os.utime(path, (mtime, mtime))
+
+        file_ingestion.prune_csv_cache(max_bytes=os.path.getsize(paths[2]))
+
+        assert [os.path.exists(path) for path in paths] == [False, False, True]
+        assert os.path.exists(results_path)
+
+    def test_read_only_folders(self, csv_file, tmp_path, monkeypatch):
+        """Nothing is written next to the CSV and an unwritable cache still reads the data"""
+        blocker = tmp_path / 'not_a_folder'
+        blocker.write_text('')
+        monkeypatch.setattr(file_ingestion, 'CSV_CACHE_DIR', str(blocker / 'cache'))
+        data_dir = os.path.dirname(csv_file)
+        os.chmod(data_dir, 0o555)
+
+        try:
+            df = self.read(csv_file)
+        finally:
+            os.chmod(data_dir, 0o755)
+
+        assert df['Velocity'].tolist() == pytest.approx([2.5, 3.1, 1.8])
+        assert os.listdir(data_dir) == ['session.csv']
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"]) 
\ No newline at end of file
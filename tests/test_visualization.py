@@ -0,0 +1,56 @@
+"""
+Test file for visualization module
+"""
+
+import numpy as np
+import pytest
+
+# Import the module to test
+import sys
+sys.path.append('src')
+from visualization import decimate_min_max
+
+
+class TestDecimateMinMax:
+    """Test cases for the min/max decimation used before plotting long series"""
+
+    @pytest.mark.parametrize('n_samples', [1001, 20000, 36001])
+    @pytest.mark.parametrize('max_points', [10, 101, 2000])
+    def test_keeps_shape_of_series(self, n_samples, max_points):
+        """First, last and each bucket's extreme samples survive, in time order"""
+        rng = np.random.default_rng(n_samples + max_points)
+        velocity = rng.uniform(0.0, 9.0, n_samples)
+
+        indices = decimate_min_max(velocity, max_points)
+
+        assert len(indices) <= max_points
+        assert np.all(np.diff(indices) > 0)
+        assert indices[0] == 0
+        assert indices[-1] == n_samples - 1
+
+        kept = set(indices.tolist())
+        bucket_size = -(-n_samples // ((max_points - 2) // 2))
+        for start in range(0, n_samples, bucket_size):
+            bucket = velocity[start:start + bucket_size]
+            assert start + int(np.argmin(bucket)) in kept
+            assert start + int(np.argmax(bucket)) in kept
+
+    def test_global_peak_survives(self):
+        """A single sprint peak in a long flat series is never dropped"""
+        velocity = np.full(50000, 2.0)
+        velocity[31337] = 9.5
+
+        indices = decimate_min_max(velocity, 100)
+
+        assert 31337 in indices
+
+    @pytest.mark.parametrize('n_samples', [0, 1, 500, 1000])
+    def test_short_series_unchanged(self, n_samples):
+        """Series already within max_points keep every sample"""
+        indices = decimate_min_max(np.linspace(0.0, 5.0, n_samples), 1000)
+
+        assert indices.tolist() == list(range(n_samples))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
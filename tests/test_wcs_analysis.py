@@ -6,12 +6,14 @@ Tests individual functions in isolation with known inputs and expected outputs
 import pytest
 import numpy as np
 import pandas as pd
+import src.wcs_analysis as wcs_analysis
 from src.wcs_analysis import (
     calculate_wcs_period_rolling,
     calculate_wcs_period_contiguous,
     calculate_kinematic_parameters,
     perform_wcs_analysis
 )
+from src.wcs_fast import NUMBA_AVAILABLE, rolling_wcs, summary_stats
 
 class TestWCSAnalysis:
     """Test suite for WCS analysis functions"""
@@ -261,6 +263,118 @@ class TestDataValidation:
                 100.0
             )
 
+
+def brute_force_wcs(velocity_data, epoch_samples, n_windows, sampling_rate,
+                    threshold_min, threshold_max):
+    """Reference WCS scan that sums every candidate window directly"""
+    best_sum, best_start = 0.0, 0
+    for start in range(n_windows):
+        window = velocity_data[start:start + epoch_samples].astype(np.float64)
+        window_sum = window[(window >= threshold_min) & (window <= threshold_max)].sum()
+        if window_sum > best_sum:
+            best_sum, best_start = window_sum, start
+
+    if best_sum <= 0:
+        return 0, 0, 0, 0
+
+    window = velocity_data[best_start:best_start + epoch_samples]
+    in_threshold = np.count_nonzero((window >= threshold_min) & (window <= threshold_max))
+    return (best_sum / sampling_rate, in_threshold / sampling_rate,
+            best_start, best_start + epoch_samples)
+
+
+@pytest.fixture(params=['numba', 'python_kernel', 'cumsum'])
+def scan_path(request, monkeypatch):
+    """Run the window scan through the numba kernel, its Python body or the cumsum fallback"""
+    if request.param == 'numba':
+        if not NUMBA_AVAILABLE:
+            pytest.skip("numba is not installed")
+        monkeypatch.setattr(wcs_analysis, 'NUMBA_AVAILABLE', True)
+    elif request.param == 'python_kernel':
+        monkeypatch.setattr(wcs_analysis, 'NUMBA_AVAILABLE', True)
+        monkeypatch.setattr(wcs_analysis, 'rolling_wcs',
+                            getattr(rolling_wcs, 'py_func', rolling_wcs))
+    else:
+        monkeypatch.setattr(wcs_analysis, 'NUMBA_AVAILABLE', False)
+    return request.param
+
+
+class TestWindowScan:
+    """Compare the fast WCS window scans against a brute-force window loop"""
+
+    @pytest.mark.parametrize('method', ['rolling', 'contiguous'])
+    # 0.25 min epochs are 15 samples (odd) at 1 Hz and 30 samples (even) at 2 Hz
+    @pytest.mark.parametrize('sampling_rate', [1, 2])
+    # The last two sessions are shorter than the epoch
+    @pytest.mark.parametrize('n_samples', [200, 201, 24, 9])
+    @pytest.mark.parametrize('thresholds', [(0.0, 100.0), (2.0, 6.0)])
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32])
+    @pytest.mark.parametrize('premasked', [False, True])
+    def test_matches_brute_force(self, scan_path, method, sampling_rate, n_samples,
+                                 thresholds, dtype, premasked):
+        """The WCS distance, time and window match a direct sum over every window"""
+        rng = np.random.default_rng(n_samples * sampling_rate)
+        velocity = rng.uniform(0.0, 8.0, n_samples).astype(dtype)
+        threshold_min, threshold_max = thresholds
+        epoch_duration = 0.25
+
+        epoch_samples = min(int(epoch_duration * 60 * sampling_rate), n_samples)
+        if method == 'rolling':
+            n_windows = n_samples - 2 * (epoch_samples // 2)
+        else:
+            n_windows = n_samples - epoch_samples + 1
+        expected = brute_force_wcs(velocity, epoch_samples, n_windows, sampling_rate,
+                                   threshold_min, threshold_max)
+
+        if premasked:
+            masked, mask = wcs_analysis.apply_velocity_threshold(velocity, threshold_min,
+                                                                 threshold_max)
+            result = wcs_analysis.calculate_wcs_period(masked, epoch_duration, sampling_rate,
+                                                       threshold_min, threshold_max, method, mask)
+        else:
+            result = wcs_analysis.calculate_wcs_period(velocity, epoch_duration, sampling_rate,
+                                                       threshold_min, threshold_max, method)
+
+        tolerance = 1e-4 if dtype == np.float32 else 1e-9
+        assert result[0] == pytest.approx(expected[0], rel=tolerance)
+        assert result[1:] == pytest.approx(expected[1:])
+
+    def test_threshold_excludes_every_sample(self, scan_path):
+        """A threshold range no sample falls in gives an empty WCS result"""
+        velocity = np.full(100, 3.0)
+        result = wcs_analysis.calculate_wcs_period(velocity, 0.25, 1, 5.0, 10.0, 'contiguous')
+
+        assert result == (0, 0, 0, 0)
+
+
+class TestSummaryStats:
+    """Compare the one-pass summary statistics against NumPy"""
+
+    @pytest.mark.parametrize('compiled', [True, False])
+    @pytest.mark.parametrize('offset', [0.0, 1e4])
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32])
+    def test_matches_numpy(self, compiled, offset, dtype):
+        """Min, max, mean and population std match NumPy, including offset-heavy data"""
+        if compiled and not NUMBA_AVAILABLE:
+            pytest.skip("numba is not installed")
+        stats = summary_stats if compiled else getattr(summary_stats, 'py_func', summary_stats)
+
+        rng = np.random.default_rng(0)
+        values = (rng.normal(3.0, 1.5, 1001) + offset).astype(dtype)
+        reference = values.astype(np.float64)
+
+        lo, hi, mean, std = stats(values)
+
+        assert lo == reference.min()
+        assert hi == reference.max()
+        assert mean == pytest.approx(reference.mean(), rel=1e-9)
+        assert std == pytest.approx(reference.std(), rel=1e-6)
+
+    def test_single_value(self):
+        """A single sample has zero spread"""
+        assert summary_stats(np.array([4.2])) == (4.2, 4.2, 4.2, 0.0)
+
+
 if __name__ == "__main__":
     # Run tests directly
     pytest.main([__file__, "-v"]) 
\ No newline at end of file